@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 import os
 import re
+import sys
+import asyncio
 import csv
+import filecmp
+import json
+import hashlib
+import mmap
 import shutil
+import sqlite3
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Iterator, Optional, List, Dict, Tuple
 
 VALID_VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".m4v", ".mov", ".wmv", ".m2ts"}
+# for str.endswith: lower + upper covers nearly every name without a .lower() call
+VIDEO_EXT_TUPLE = tuple(VALID_VIDEO_EXTENSIONS) + tuple(e.upper() for e in VALID_VIDEO_EXTENSIONS)
 
 # ---- ANSI colors ----
 C_RESET  = "\033[0m"
@@ -21,8 +35,22 @@ JUNK_TOKENS_RE = re.compile(r"""(?ix)\b(2160p|1080p|720p|480p|360p|x264|h264|avc
 SAMPLE_DIR_NAMES = {"sample", "samples"}
 SAMPLE_NAME_HINTS = {"sample"}  # you can expand later: {"sample", "rarbg"}
 QUARANTINE_DIRNAME = "_SAMPLES"
+PROBE_CACHE_PATH = Path.home() / ".cache" / "file_cleanup" / "ffprobe.sqlite"
+# "content" = same size + same head/tail bytes (catches renamed copies)
+# "name"    = same normalized name + same size (the old, conservative check)
+DUPE_MODE = "content"
+DUPE_SAMPLE_BYTES = 64 * 1024
+PROGRESS_INTERVAL = 0.05  # seconds between progress redraws
+progress_last_ts = 0.0
 
 YEAR_RE = re.compile(r"(?<!\d)(19\d{2}|20\d{2})(?!\d)")
+SEPARATOR_TO_SPACE = str.maketrans("._-", "   ")
+# JUNK_TOKENS_RE and YEAR_RE as one alternation, so variant keys need a single pass.
+# Their matches can't overlap (no junk token contains a 19xx/20xx run).
+VARIANT_SCAN_RE = re.compile(
+    r"(?P<junk>" + JUNK_TOKENS_RE.pattern.replace("(?ix)", "", 1) + r")|(?P<year>" + YEAR_RE.pattern + r")",
+    re.IGNORECASE | re.VERBOSE,
+)
 def is_sample_dir(path: Path) -> bool:
     return path.is_dir() and path.name.lower() in SAMPLE_DIR_NAMES
 
@@ -37,66 +65,97 @@ def looks_like_sample_file(path: Path) -> bool:
     return False
 
 def progress(i: int, total: int, *, every: int = 1, prefix: str = "") -> None:
+    global progress_last_ts
     if total == 0:
         return
     if i == 1 or i == total or (i % every == 0):
+        # redraw at most ~20x a second; a flush per file is slow on some terminals
+        now = time.monotonic()
+        if i not in (1, total) and now - progress_last_ts < PROGRESS_INTERVAL:
+            return
+        progress_last_ts = now
         pct = (i / total) * 100
         print(f"{prefix}{i}/{total} ({pct:5.1f}%)", end="\r", flush=True)
         if i == total:
             print()  # newline at end
             
-def quarantine_sample(path: Path, root: Path) -> Optional[Path]:
+def resolve_collision(dst: str) -> str:
+    """If dst exists, append ' - dupN' before the extension."""
+    if not os.path.lexists(dst):
+        return dst
+    stem, ext = os.path.splitext(dst)
+    for i in range(1, 1000):
+        cand = f"{stem} - dup{i}{ext}"
+        if not os.path.lexists(cand):
+            return cand
+    raise RuntimeError(f"Too many collisions for {dst}")
+
+def quarantine_sample(path: str, root: str) -> Optional[str]:
     """
     Move a sample dir/file into root/_SAMPLES preserving name.
     Returns new path if moved, else None.
+    Plain string paths + os calls, since this runs once per sample in bulk.
     """
-    dest_dir = root / QUARANTINE_DIRNAME
-    dest_dir.mkdir(exist_ok=True)
+    dest_dir = os.path.join(root, QUARANTINE_DIRNAME)
+    os.makedirs(dest_dir, exist_ok=True)
 
-    dest = dest_dir / path.name
-    dest = resolve_collision(dest)
+    dest = resolve_collision(os.path.join(dest_dir, os.path.basename(path)))
 
     try:
-        path.rename(dest)
+        os.rename(path, dest)
         return dest
     except PermissionError:
         # if uchg locked, you can reuse your unlock prompt flow here if desired
         return None
 
+@lru_cache(maxsize=8192)
 def variant_key_from_filename(name: str) -> str:
     """
     Build a movie identity key used ONLY for grouping variants.
     Strips: copy/(1), extension, junk tokens (1080p/x265/etc), normalizes separators.
     Keeps: title words + year (if present) so remakes don't collide.
+    Cached, since options 6/7 and repeat runs see the same names again.
     """
-    # strip duplicate markers and extension(s)
+    # strip duplicate markers and extension (already lowercased)
     base = normalize_dupe_name(name)
-    p = Path(base)
-    stem = p.stem  # stem WITHOUT extension(s)
+    dot = base.rfind(".")
+    stem = base[:dot] if 0 < dot < len(base) - 1 else base
 
-    # normalize separators
-    s = re.sub(r"[._\-]+", " ", stem).strip()
+    # normalize separators (plain char mapping, no regex needed)
+    s = stem.translate(SEPARATOR_TO_SPACE)
 
-    # keep year if present (helps avoid collisions)
-    year = YEAR_RE.search(s)
-    y = year.group(1) if year else ""
+    # one scan: keep the first year (helps avoid collisions), drop junk tokens (quality/source/etc)
+    years: List[str] = []
 
-    # remove junk tokens (quality/source/etc)
-    s = JUNK_TOKENS_RE.sub("", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    def strip(m: re.Match) -> str:
+        if m.lastgroup == "year":
+            years.append(m.group("year"))
+            return m.group(0)
+        return ""
+
+    s = " ".join(VARIANT_SCAN_RE.sub(strip, s).split())
+    y = years[0] if years else ""
 
     # build key
-    return (s + (" " + y if y else "")).strip().lower()
+    return (s + (" " + y if y else "")).strip()
 
 def colorize(s: str, c: str) -> str:
     return f"{c}{s}{C_RESET}"
 
 def clear_screen():
-    os.system("cls" if os.name == "nt" else "clear")
+    # plain ANSI instead of spawning `clear`/`cls` on every redraw;
+    # skipped when output is piped/logged so files don't fill with escape codes
+    if not sys.stdout.isatty():
+        return
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
 
 # ---- light parsing from filename (fallback) ----
-RES_RE = re.compile(r"\b(2160|1080|720|480|360)p\b", re.IGNORECASE)
-CODEC_RE = re.compile(r"\b(x265|h265|hevc)\b", re.IGNORECASE)
+# resolution and HEVC hints in one pass over the name
+NAME_HINTS_RE = re.compile(
+    r"(?P<res>\b(?:2160|1080|720|480|360)p\b)|(?P<codec>\b(?:x265|h265|hevc)\b)",
+    re.IGNORECASE,
+)
 
 @dataclass
 class MediaInfo:
@@ -126,53 +185,207 @@ LABEL_FOR_COLOR = {
     C_RESET: "INFO"
 }
 
-def ffprobe_info(p: Path) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]:
+async def ffprobe_info(p: str, exe: str = "ffprobe") -> Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]:
     """
     Returns (width, height, bitrate_bps, codec_name) using ffprobe.
     bitrate may be None for some containers; we’ll still classify with what we have.
+    exe can be the full path to ffprobe so each spawn skips the PATH search.
     """
     cmd = [
-        "ffprobe", "-v", "error",
+        exe, "-v", "error",
+        "-threads", "1",  # parallelism comes from running many probes at once
         "-select_streams", "v:0",
         "-show_entries", "stream=width,height,codec_name:format=bit_rate",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(p)
+        "-of", "json=compact=1",  # one line per object; less for json.loads to chew through
+        "-i", p,  # explicit, so a file named "-something" isn't read as an option
     ]
-    # Output order: width, height, codec_name, format_bit_rate (depends a bit; handle defensively)
     try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True).strip().splitlines()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        out, _ = await proc.communicate()
+        if proc.returncode != 0:
+            return None, None, None, None
+        data = json.loads(out)
     except Exception:
         return None, None, None, None
 
-    width = height = bitrate = None
-    codec = None
+    streams = data.get("streams") or [{}]
+    stream = streams[0]
+    fmt = data.get("format") or {}
 
-    # Common case: [width, height, codec_name, bit_rate]
-    # Sometimes bit_rate missing; sometimes format appears but stream doesn't.
-    nums = []
-    for line in out:
-        if line.isdigit():
-            nums.append(int(line))
-        elif line:
-            codec = line
+    width = stream.get("width")
+    height = stream.get("height")
+    codec = stream.get("codec_name")
 
-    if len(nums) >= 2:
-        width, height = nums[0], nums[1]
-    if len(nums) >= 3:
-        # format bit_rate usually last numeric line
-        bitrate = nums[-1] if nums[-1] > 10_000 else None
+    # bit_rate comes back as a string, and is missing for some containers
+    raw_bitrate = str(fmt.get("bit_rate", ""))
+    bitrate = int(raw_bitrate) if raw_bitrate.isdigit() else None
 
     return width, height, bitrate, codec
 
+def load_probe_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk ffprobe cache (sqlite), or None if it can't be used."""
+    try:
+        PROBE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(PROBE_CACHE_PATH))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS probe ("
+            " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER,"
+            " width INTEGER, height INTEGER, bitrate INTEGER, codec TEXT)"
+        )
+        return conn
+    except Exception:
+        return None
+
+def ffprobe_many(files: List[Tuple[str, os.stat_result]], *, prefix: str = "") -> List[Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]]:
+    """
+    Run ffprobe_info over (path, stat) pairs from collect_media() with a fixed pool of
+    asyncio workers, so several ffprobe processes are always in flight. Results come
+    back in the same order as files.
+
+    Results are cached on disk keyed by path and checked against (mtime_ns, size),
+    so unchanged files are never re-probed. New results are saved in one
+    transaction at the end (or when interrupted).
+    """
+    total = len(files)
+    results: List[Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]] = [(None, None, None, None)] * total
+    misses: List[Tuple[int, str, Tuple[int, int]]] = []
+    fresh: List[Tuple[str, int, int, Optional[int], Optional[int], Optional[int], Optional[str]]] = []
+
+    cache = load_probe_cache()
+    done = 0
+    for i, (p, st) in enumerate(files):
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        hit = None
+        if cache is not None:
+            hit = cache.execute(
+                "SELECT width, height, bitrate, codec FROM probe WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (p, st.st_mtime_ns, st.st_size),
+            ).fetchone()
+        if hit:
+            results[i] = hit
+            done += 1
+            progress(done, total, every=1, prefix=prefix)
+        else:
+            misses.append((i, p, stamp))
+
+    async def worker(todo: Iterator[Tuple[int, str, Tuple[int, int]]], exe: str) -> None:
+        # workers share one iterator; each grabs the next file as soon as its probe ends
+        nonlocal done
+        for i, p, stamp in todo:
+            res = await ffprobe_info(p, exe)
+            results[i] = res
+            # don't remember failures; a later run may be able to read the file
+            if res != (None, None, None, None):
+                fresh.append((p, stamp[1], stamp[0], *res))
+            done += 1
+            progress(done, total, every=1, prefix=prefix)
+
+    async def probe_misses() -> None:
+        # ffprobe mostly waits on disk, so allow more than one per core (helps on network shares)
+        workers = min(32, (os.cpu_count() or 1) * 4, len(misses))
+        exe = shutil.which("ffprobe") or "ffprobe"  # resolved once, not per spawn
+        todo = iter(misses)
+        await asyncio.gather(*(worker(todo, exe) for _ in range(workers)))
+
+    try:
+        if misses:
+            asyncio.run(probe_misses())
+    finally:
+        if cache is not None:
+            try:
+                with cache:  # commits the batch as one transaction
+                    cache.executemany("INSERT OR REPLACE INTO probe VALUES (?, ?, ?, ?, ?, ?, ?)", fresh)
+            except sqlite3.Error:
+                pass
+            cache.close()
+
+    return results
+
 def guess_from_name(name: str) -> Tuple[Optional[int], bool]:
-    m = RES_RE.search(name)
-    guessed_res = int(m.group(1)) if m else None
-    is_hevc = bool(CODEC_RE.search(name))
+    guessed_res = None
+    is_hevc = False
+    for m in NAME_HINTS_RE.finditer(name):
+        if m.lastgroup == "res":
+            if guessed_res is None:
+                guessed_res = int(m.group("res")[:-1])
+        else:
+            is_hevc = True
+            if guessed_res is not None:
+                break
     return guessed_res, is_hevc
 
-def collect_media(root: Path) -> List[Path]:
-    return [p for p in root.rglob("*")
-            if p.is_file() and p.suffix.lower() in VALID_VIDEO_EXTENSIONS]
+def walk_files(root: Path) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """
+    Walk ALL nested dirs under root and yield (DirEntry, in_sample_dir) for every file.
+    Uses os.scandir directly so file/dir checks come from the directory read
+    (no extra stat per entry) and no Path is built for directories.
+    in_sample_dir is True when the file sits anywhere under a Sample/Samples folder;
+    it's tracked per directory on the stack, not worked out again for each file.
+    Directories we can't read are skipped.
+    """
+    root_in_sample = any(part.lower() in SAMPLE_DIR_NAMES for part in Path(root).parts)
+    stack = [(str(root), root_in_sample)]
+    while stack:
+        dirpath, in_sample = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append((e.path, in_sample or e.name.lower() in SAMPLE_DIR_NAMES))
+                    elif e.is_file():
+                        yield e, in_sample
+                except OSError:
+                    continue
+
+def collect_media(root: Path) -> List[Tuple[str, os.stat_result]]:
+    """
+    Returns (path, stat) for every video under root.
+    The stat is taken once here so later passes (sizes, probe cache) don't re-stat.
+    Paths are plain strings; there can be a lot of them, so no Path object per file.
+    """
+    out: List[Tuple[str, os.stat_result]] = []
+    for e, _in_sample in walk_files(root):
+        name = e.name
+        # mixed-case extensions (".Mkv") fall through to the lowercase check
+        if not (name.endswith(VIDEO_EXT_TUPLE) or name.lower().endswith(VIDEO_EXT_TUPLE)):
+            continue
+        try:
+            out.append((e.path, e.stat()))
+        except OSError:
+            continue
+    return out
+
+def collect_report_media(root: Path) -> Tuple[List[Tuple[str, os.stat_result]], int]:
+    """
+    collect_media() for the quality report: same walk, but sample files are dropped
+    as they're found (and never statted) instead of filtered in a second pass.
+    Returns ((path, stat) list, number of samples skipped).
+    """
+    out: List[Tuple[str, os.stat_result]] = []
+    skipped = 0
+    for e, in_sample_dir in walk_files(root):
+        name = e.name
+        if not (name.endswith(VIDEO_EXT_TUPLE) or name.lower().endswith(VIDEO_EXT_TUPLE)):
+            continue
+        # same rule as is_sample_path(), with the folder part already known
+        if in_sample_dir or "sample" in name.lower():
+            skipped += 1
+            continue
+        try:
+            out.append((e.path, e.stat()))
+        except OSError:
+            continue
+    return out, skipped
 
 def bps_to_mbps(bps: Optional[int]) -> Optional[float]:
     if not bps:
@@ -180,82 +393,242 @@ def bps_to_mbps(bps: Optional[int]) -> Optional[float]:
     return bps / 1_000_000.0
 
 def quality_tag(info: MediaInfo) -> str:
-    if info.height:
-        res = f"{info.height}p"
-    elif info.guessed_res:
-        res = f"{info.guessed_res}p"
-    else:
-        res = "?p"
-    codec = "HEVC" if info.is_hevc else "H264"
-    return f"{res:6} {codec}"
+    return quality_tag_for(info.height or info.guessed_res, info.is_hevc)
+
+def quality_tag_for(res: Optional[int], is_hevc: bool) -> str:
+    res_text = f"{res}p" if res else "?p"
+    codec = "HEVC" if is_hevc else "H264"
+    return f"{res_text:6} {codec}"
 
 
 def classify(info: MediaInfo) -> Tuple[str, str]:
-    res = info.height if info.height else info.guessed_res
+    return classify_res(info.height or info.guessed_res, info.is_hevc)
+
+# (res_bucket, is_hevc) -> (label, color)
+# res_bucket: 2 = 2160p+, 1 = 1080p+, 0 = below 1080p, -1 = unknown
+CLASSIFY_TABLE = {
+    (2, True):  ("4K", C_BLUE),
+    (1, True):  ("GOOD", C_GREEN),
+    (2, False): ("MID", C_YELLOW),  # exactly one low (codec)
+    (1, False): ("MID", C_YELLOW),
+    (0, True):  ("MID", C_YELLOW),  # exactly one low (res)
+    (0, False): ("LOW", C_RED),     # both low
+    (-1, True):  ("UNK", C_YELLOW),  # don’t accidentally mark green
+    (-1, False): ("UNK", C_YELLOW),
+}
 
-    low_res = (res is not None and res < 1080)
-    low_codec = (not info.is_hevc)  # your “low bitrate”
+# same keys, with what the report needs per file: (color, severity, label_text)
+REPORT_TABLE = {
+    key: (col, SEVERITY.get(col, 9), LABEL_FOR_COLOR.get(col, "INFO"))
+    for key, (_label, col) in CLASSIFY_TABLE.items()
+}
 
-    if info.is_hevc and res is not None and res >= 2160:
-        return "4K", C_BLUE
+def res_bucket(res: Optional[int]) -> int:
+    if res is None:
+        return -1
+    if res >= 2160:
+        return 2
+    if res >= 1080:
+        return 1
+    return 0
+
+def classify_res(res: Optional[int], is_hevc: bool) -> Tuple[str, str]:
+    return CLASSIFY_TABLE[(res_bucket(res), is_hevc)]
+
+@lru_cache(maxsize=None)
+def report_fields(res: Optional[int], is_hevc: bool) -> Tuple[str, int, str, str]:
+    """
+    (color, severity, label_text, tag) for one (res, hevc) state.
+    A library only has a handful of distinct states, so after the first file of
+    each kind the report gets everything from a single cached call.
+    """
+    col, severity, label_text = REPORT_TABLE[(res_bucket(res), is_hevc)]
+    return col, severity, label_text, quality_tag_for(res, is_hevc)
 
-    if info.is_hevc and res is not None and res >= 1080:
-        return "GOOD", C_GREEN
 
-    if res is None:
-        return "UNK", C_YELLOW  # don’t accidentally mark green
 
-    # exactly one low
-    if low_res ^ low_codec:
-        return "MID", C_YELLOW
+def safe_unlink(path: str) -> int:
+    """Delete path; 1 if it went, 0 if it didn't (already gone, no permission, ...)."""
+    try:
+        os.unlink(path)
+        return 1
+    except OSError:
+        return 0
+
+def cleanup_trash(root: Path) -> int:
+    trash = [
+        e.path for e, _in_sample in walk_files(root)
+        if e.name == ".DS_Store" or e.name.startswith("._")
+    ]
+    # each unlink is a metadata round trip (slow on NAS shares), so run a bunch at once
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        return sum(ex.map(safe_unlink, trash))
+
+QUALITY_CSV_FIELDS = ["path", "size_bytes", "width", "height", "hevc", "label", "tag"]
+
+def write_quality_report(
+    files: List[Tuple[str, os.stat_result]],
+    probe_results: List[Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]],
+    out_csv: Path,
+) -> Tuple[List[Tuple[int, str, str, str, str, str]], Dict[str, int]]:
+    """
+    Classify every file using its probe result and write quality_report.csv.
+    CSV rows go out as they're classified (scan order); only the small tuples needed
+    for the sorted terminal view are kept:
+      entries = [(severity, filename_casefold, color, label_text, tag, filename), ...]
+    Returns (entries, counts per label).
+    """
+    entries: List[Tuple[int, str, str, str, str, str]] = []
 
-    # both low
-    if low_res and low_codec:
-        return "LOW", C_RED
+    out_csv.parent.mkdir(parents=True, exist_ok=True)
+    # big buffer + plain csv.writer with rows already in QUALITY_CSV_FIELDS order
+    with out_csv.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(QUALITY_CSV_FIELDS)
 
-    return "OK", C_RESET
+        for (p, st), (width, height, _bitrate, codec) in zip(files, probe_results):
+            name = os.path.basename(p)
+            guessed_res, guessed_hevc = guess_from_name(name)
 
+            is_hevc = guessed_hevc or (codec or "").lower() in {"hevc", "h265"}
 
+            # same rules as classify()/quality_tag(), minus a MediaInfo per file
+            col, severity, label_text, tag = report_fields(height or guessed_res, is_hevc)
 
-def cleanup_trash(root: Path) -> int:
-    deleted = 0
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
-        if p.name == ".DS_Store" or p.name.startswith("._"):
-            try:
-                p.unlink()
-                deleted += 1
-            except Exception:
-                pass
-    return deleted
+            w.writerow((
+                p,
+                st.st_size,
+                width,  # csv writes None as ""
+                height,
+                "yes" if is_hevc else "no",
+                label_text,
+                tag,
+            ))
+
+            entries.append((severity, name.casefold(), col, label_text, tag, name))
 
-def write_quality_csv(rows: List[Dict[str, str]], out_path: Path) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    fields = ["path", "size_bytes", "width", "height", "hevc", "label", "tag"]
-    with out_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+    # tallied in one pass at the end (Counter does the counting loop in C)
+    counts = Counter(map(itemgetter(3), entries))
+    return entries, counts
 
 
-def group_duplicates_by_name_size(files: List[Path]) -> Dict[Tuple[str, int], List[Path]]:
+def group_duplicates_by_name_size(files: List[Tuple[str, os.stat_result]]) -> Dict[Tuple[str, int], List[str]]:
     """
     Fast duplicate grouping: (lower_name, size_bytes).
     This catches obvious dupes like "movie.mkv" and "movie.mkv (1)" that are same size.
+    Takes the (path, stat) pairs from collect_media() so nothing is re-statted.
     """
-    groups: Dict[Tuple[str, int], List[Path]] = {}
-    for p in files:
-        try:
-            size = p.stat().st_size
-        except Exception:
+    # pass 1: sizes only; a file with a unique size can't be a dupe,
+    # so most files never get their name normalized
+    by_size: Dict[int, List[str]] = defaultdict(list)
+    for p, st in files:
+        by_size[st.st_size].append(p)
+
+    # pass 2: (name, size) within buckets that have 2+ files
+    groups: Dict[Tuple[str, int], List[str]] = defaultdict(list)
+    for size, paths in by_size.items():
+        if len(paths) < 2:
             continue
-        key = (normalize_dupe_name(p.name), size)
-        groups.setdefault(key, []).append(p)
+        for p in paths:
+            groups[(normalize_dupe_name(os.path.basename(p)), size)].append(p)
     return {k: v for k, v in groups.items() if len(v) > 1}
 
-def interactive_variant_review(variant_groups: Dict[str, List[Path]]) -> None:
+def sample_digest(p: str) -> Optional[str]:
+    """
+    Hash the first and last DUPE_SAMPLE_BYTES of a file (the whole thing if it's small).
+    The file is mmapped and hashed straight from the mapping, so only the pages
+    we touch get read and nothing is copied into Python bytes.
+    Returns None if the file can't be read.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(p, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                size = len(view)
+                h.update(view[:DUPE_SAMPLE_BYTES])
+                if size > DUPE_SAMPLE_BYTES:
+                    h.update(view[max(DUPE_SAMPLE_BYTES, size - DUPE_SAMPLE_BYTES):])
+    except (OSError, ValueError):  # ValueError: file went empty, can't map 0 bytes
+        return None
+    return h.hexdigest()
+
+def group_duplicates_by_content(files: List[Tuple[str, os.stat_result]]) -> Dict[Tuple[str, int], List[str]]:
+    """
+    Size-first duplicate grouping: files are bucketed by size (free, we already
+    have the stat), and only buckets with 2+ files get read and hashed.
+    Keys are (display_name, size_bytes) like group_duplicates_by_name_size, where
+    display_name is the first file's name plus a short hash so groups stay distinct.
+    Only the sampled head/tail is compared, so a group is a likely match, not a
+    proven one; the review's d! does a full compare before deleting anything.
+    """
+    by_size: Dict[int, List[str]] = defaultdict(list)
+    for p, st in files:
+        if st.st_size > 0:  # empty files all "match"; not useful here
+            by_size[st.st_size].append(p)
+
+    candidates = [(size, p) for size, paths in by_size.items() if len(paths) > 1 for p in paths]
+
+    # hashing is mostly waiting on the disk (and hashlib drops the GIL), so threads help
+    with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as ex:
+        digests = ex.map(sample_digest, [p for _size, p in candidates])
+
+        by_hash: Dict[Tuple[int, str], List[str]] = defaultdict(list)
+        for (size, p), digest in zip(candidates, digests):
+            if digest is not None:
+                by_hash[(size, digest)].append(p)
+
+    groups: Dict[Tuple[str, int], List[str]] = {}
+    for (size, digest), same in by_hash.items():
+        if len(same) > 1:
+            groups[(f"{os.path.basename(same[0])} [{digest[:8]}]", size)] = same
+    return groups
+
+def group_duplicates(files: List[Tuple[str, os.stat_result]]) -> Dict[Tuple[str, int], List[str]]:
+    if DUPE_MODE == "name":
+        return group_duplicates_by_name_size(files)
+    return group_duplicates_by_content(files)
+
+def delete_all_but_first(items: List[str], compare: bool = False) -> Tuple[int, int, int]:
+    """
+    Bulk mode for the review screens: keep items[0], unlink the rest.
+    With compare, each file is first checked byte-for-byte against items[0] and
+    left alone if it differs (duplicate groups only match on a sample).
+    Returns (deleted, failed, skipped).
+    """
+    deleted = failed = skipped = 0
+    keep = items[0]
+    for target in items[1:]:
+        if compare:
+            try:
+                same = filecmp.cmp(keep, target, shallow=False)
+            except OSError as e:
+                same = False
+                print(colorize(f"Could not compare {target}: {e}", C_RED))
+            if not same:
+                skipped += 1
+                print(colorize(f"Skipped (not identical to #1): {target}", C_YELLOW))
+                continue
+        try:
+            os.unlink(target)
+            deleted += 1
+        except OSError as e:
+            failed += 1
+            print(colorize(f"Failed to delete {target}: {e}", C_RED))
+    return deleted, failed, skipped
+
+def bulk_delete_prompt(items: List[str], what: str, compare: bool = False) -> None:
+    """Confirm once, then keep #1 / delete the rest of the group on screen."""
+    print(f"\nThis keeps #1 and deletes the other {len(items) - 1} {what} in this group.")
+    if compare:
+        print("Each one is compared in full against #1 first; any that differ are kept.")
+    confirm = input("Type YES to continue: ").strip()
+    if confirm != "YES":
+        input("Cancelled. (enter)")
+        return
+    deleted, failed, skipped = delete_all_but_first(items, compare)
+    input(f"\nDeleted {deleted} file(s), {failed} failed, {skipped} skipped. (enter)")
+
+def interactive_variant_review(variant_groups: Dict[str, List[str]]) -> None:
     keys = sorted(variant_groups.keys())
 
     for key in keys:
@@ -266,12 +639,13 @@ def interactive_variant_review(variant_groups: Dict[str, List[Path]]) -> None:
         print(f"Key: {key}\n")
 
         for i, p in enumerate(items, start=1):
-            size = p.stat().st_size
+            size = os.stat(p).st_size
             print(f"  {i}) {size} bytes | {p}")
 
         print("\nActions:")
         print("  k) keep all (skip)")
         print("  d) delete one or more")
+        print("  d!) keep #1 (largest), delete the rest of this group")
         print("  s) stop")
 
         choice = input("Select action: ").strip().lower()
@@ -279,6 +653,11 @@ def interactive_variant_review(variant_groups: Dict[str, List[Path]]) -> None:
             return
         if choice == "k":
             continue
+        if choice == "d!":
+            # this group only: variants can be different cuts (extended, director's),
+            # so unlike exact duplicates they aren't safe to clear in bulk
+            bulk_delete_prompt(items, "variants")
+            continue
         if choice == "d":
             sel = input("Enter numbers to delete (e.g. 2 3), or b to back: ").strip().lower()
             if sel == "b":
@@ -300,36 +679,39 @@ def interactive_variant_review(variant_groups: Dict[str, List[Path]]) -> None:
             for n in nums:
                 target = items[n-1]
                 try:
-                    target.unlink()
+                    os.unlink(target)
                     print(colorize(f"Deleted: {target}", C_RED))
                 except Exception as e:
                     print(colorize(f"Failed to delete {target}: {e}", C_RED))
 
             input("\nDone. (enter)")
 
-def group_variants_by_name(files: List[Path]) -> Dict[str, List[Path]]:
-    groups: Dict[str, List[Path]] = {}
-    for p in files:
-        key = variant_key_from_filename(p.name)
-        groups.setdefault(key, []).append(p)
+def group_variants_by_name(sizes: Dict[str, int]) -> Dict[str, List[str]]:
+    """
+    sizes maps path -> size in bytes, built from collect_media()'s stats,
+    so sorting by size doesn't stat anything again.
+    """
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for p in sizes:
+        groups[variant_key_from_filename(os.path.basename(p))].append(p)
 
     # only groups with 2+ videos
     groups = {k: v for k, v in groups.items() if len(v) > 1}
 
     # sort each group by size desc (largest first)
     for k, items in groups.items():
-        groups[k] = sorted(items, key=lambda x: x.stat().st_size, reverse=True)
+        groups[k] = sorted(items, key=sizes.__getitem__, reverse=True)
     return groups
 
-def interactive_duplicate_review(dupe_groups: Dict[Tuple[str, int], List[Path]]) -> None:
+def interactive_duplicate_review(dupe_groups: Dict[Tuple[str, int], List[str]]) -> None:
     """
     One group at a time:
-      k = keep all
-      d = delete selected
-      s = stop
+      k  = keep all
+      d  = delete selected
+      d! = keep #1, delete the rest of this group (each checked in full against #1)
+      s  = stop
     """
-    keys = list(dupe_groups.keys())
-    keys.sort(key=lambda k: k[0])
+    keys = sorted(dupe_groups, key=itemgetter(0))
 
     for key in keys:
         name, size = key
@@ -346,6 +728,7 @@ def interactive_duplicate_review(dupe_groups: Dict[Tuple[str, int], List[Path]])
         print("\nActions:")
         print("  k) keep all (skip)")
         print("  d) delete one or more")
+        print("  d!) keep #1, delete the rest of this group (full compare first)")
         print("  s) stop")
 
         choice = input("Select action: ").strip().lower()
@@ -353,6 +736,11 @@ def interactive_duplicate_review(dupe_groups: Dict[Tuple[str, int], List[Path]])
             return
         if choice == "k":
             continue
+        if choice == "d!":
+            # groups only match on size + a sample (or name + size), so check
+            # the whole file before deleting anything
+            bulk_delete_prompt(items, "duplicates", compare=True)
+            continue
         if choice == "d":
             sel = input("Enter numbers to delete (e.g. 2 3), or b to back: ").strip().lower()
             if sel == "b":
@@ -374,7 +762,7 @@ def interactive_duplicate_review(dupe_groups: Dict[Tuple[str, int], List[Path]])
             for n in nums:
                 target = items[n-1]
                 try:
-                    target.unlink()
+                    os.unlink(target)
                     print(colorize(f"Deleted: {target}", C_RED))
                 except Exception as e:
                     print(colorize(f"Failed to delete {target}: {e}", C_RED))
@@ -393,24 +781,25 @@ DUPE_SUFFIX_RE = re.compile(
 )
 
 def count_dir_stats(dirpath: Path) -> tuple[int, int]:
+    # scandir hands back the entry type, so no stat per child just to tell dirs from files
     subdirs = 0
     vids = 0
-    for p in dirpath.iterdir():
-        if p.is_dir():
-            subdirs += 1
-        elif p.is_file() and p.suffix.lower() in VALID_VIDEO_EXTENSIONS:
-            vids += 1
+    with os.scandir(dirpath) as it:
+        for e in it:
+            if e.is_dir():
+                subdirs += 1
+            elif e.is_file() and e.name.lower().endswith(VIDEO_EXT_TUPLE):
+                vids += 1
     return subdirs, vids
 
-def write_variants_csv(variants: Dict[str, List[Path]], out_csv: Path) -> None:
+def write_variants_csv(variants: Dict[str, List[str]], sizes: Dict[str, int], out_csv: Path) -> None:
     out_csv.parent.mkdir(parents=True, exist_ok=True)
     with out_csv.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(["normalized_name", "count", "sizes_bytes", "paths"])
-        for name, paths in sorted(variants.items(), key=lambda x: x[0]):
-            sizes = [p.stat().st_size for p in paths]
-            w.writerow([name, len(paths), " | ".join(map(str, sizes)),
-                        " | ".join(str(p) for p in paths)])
+        for name, paths in sorted(variants.items(), key=itemgetter(0)):
+            w.writerow([name, len(paths), " | ".join(str(sizes[p]) for p in paths),
+                        " | ".join(paths)])
 
 def browse_for_directory(start: Path) -> Optional[Path]:
     cwd = start.expanduser().resolve()
@@ -420,7 +809,8 @@ def browse_for_directory(start: Path) -> Optional[Path]:
         print("Browse for SOURCE directory\n")
         print(f"Current: {cwd}\n")
 
-        dirs = sorted([p for p in cwd.iterdir() if p.is_dir()])
+        with os.scandir(cwd) as it:
+            dirs = sorted(Path(e.path) for e in it if e.is_dir())
 
         print("  0) .. (up one level)")
         for i, d in enumerate(dirs, start=1):
@@ -472,11 +862,17 @@ def normalize_dupe_name(name: str) -> str:
       "Movie copy.mkv" -> "movie.mkv"
     Keeps extension intact.
     """
-    p = Path(name)
-    stem = p.stem
-    ext = "".join(p.suffixes)  # handles .eng.srt etc if you ever reuse this
-    stem = COPY_TAIL_RE.sub("", stem).strip()
-    return (stem + ext).lower()
+    stem, dot, ext = name.rpartition(".")
+    if not stem or not ext:
+        # no extension (or a dotfile like ".DS_Store")
+        stem, dot, ext = name, "", ""
+    # COPY_TAIL_RE gets tried at every offset of the stem, so only run it
+    # when the stem could actually end in a marker (most names don't)
+    tail = stem.rstrip()[-9:].lower()
+    if tail.endswith((")", "copy", "dup", "duplicate")):
+        stem = COPY_TAIL_RE.sub("", stem)
+    stem = stem.strip()
+    return (stem + dot + ext).lower()
 
 def print_menu(source: Optional[Path]) -> None:
     print("Phase 0 — Hygiene Menu\n")
@@ -484,32 +880,36 @@ def print_menu(source: Optional[Path]) -> None:
     print("1) Set SOURCE (manual / browse)")
     print("2) Cleanup trash (.DS_Store / ._*)")
     print("3) Generate quality report (color + CSV)")
-    print("4) Duplicates report (same name + same size)")
+    if DUPE_MODE == "name":
+        print("4) Duplicates report (same name + same size)")
+    else:
+        print(f"4) Duplicates report (same size + same first/last {DUPE_SAMPLE_BYTES // 1024}KB)")
     print("5) Review duplicates (interactive delete)")
     print("6) Variants report (same name, different sizes)")
     print("7) Review variants (interactive delete)")
     print("8) Exit")
 
-def is_sample_path(p: Path) -> bool:
+def is_sample_path(p: str) -> bool:
     """
     True if path is a sample file or is contained inside a Sample/Samples directory.
-    Works for files returned by collect_media() (which are files).
+    Works for paths returned by collect_media() (which are files, so no is_file() check).
     """
-    try:
-        # Any parent folder named "sample" or "samples"
-        if any(part.lower() in SAMPLE_DIR_NAMES for part in p.parts):
-            return True
-    except Exception:
-        pass
+    parts = p.lower().split(os.sep)
+
+    # Any parent folder named "sample" or "samples"
+    if any(part in SAMPLE_DIR_NAMES for part in parts):
+        return True
 
-    # If filename itself hints sample
-    return looks_like_sample_file(p)
+    # If filename itself hints sample (same rule as looks_like_sample_file)
+    return "sample" in parts[-1]
 
 def main():
+    if os.name == "nt":
+        os.system("")  # makes the Windows console honour ANSI escapes (colors + clear_screen)
+
     source: Optional[Path] = None
-    last_quality_rows: List[Dict[str, str]] = []
-    last_dupes: Dict[Tuple[str, int], List[Path]] = {}
-    last_variants: Dict[str, List[Path]] = {}
+    last_dupes: Dict[Tuple[str, int], List[str]] = {}
+    last_variants: Dict[str, List[str]] = {}
 
     while True:
         clear_screen()
@@ -551,64 +951,30 @@ def main():
                 continue
 
             use_ff = has_ffprobe()
-            files_all = collect_media(source)
-
-            # filter out sample content
-            files = [p for p in files_all if not is_sample_path(p)]
-
-            skipped = len(files_all) - len(files)
-            print(f"Collected: {len(files_all)} media files | Skipping samples: {skipped} | Reporting: {len(files)}")
 
-            entries = []  # (severity, color, label_text, tag, filename, rowdict)
-            counts = {"RED": 0, "YELLOW": 0, "BLUE": 0, "GREEN": 0, "INFO": 0}
+            # one walk: sample content is filtered out as it's found
+            files, skipped = collect_report_media(source)
 
-            total_files = len(files)
+            print(f"Collected: {len(files) + skipped} media files | Skipping samples: {skipped} | Reporting: {len(files)}")
 
-            for idx, p in enumerate(files, start=1):
-                progress(idx, total_files, every=1, prefix="Analyzing: ")
-
-                guessed_res, guessed_hevc = guess_from_name(p.name)
-
-                width = height = bitrate = None
-                codec = None
-                if use_ff:
-                    width, height, bitrate, codec = ffprobe_info(p)
-
-                is_hevc = guessed_hevc or (codec or "").lower() in {"hevc", "h265"}
-
-                info = MediaInfo(
-                    path=p,
-                    width=width,
-                    height=height,
-                    bitrate_bps=bitrate,
-                    is_hevc=is_hevc,
-                    guessed_res=guessed_res
-                )
-
-                _label_short, col = classify(info)
-                tag = quality_tag(info)
-
-                label_text = LABEL_FOR_COLOR.get(col, "INFO")
-                counts[label_text] = counts.get(label_text, 0) + 1
-
-                row = {
-                    "path": str(p),
-                    "size_bytes": str(p.stat().st_size),
-                    "width": "" if width is None else str(width),
-                    "height": "" if height is None else str(height),
-                    "hevc": "yes" if is_hevc else "no",
-                    "label": label_text,
-                    "tag": tag,
-                }
+            # phase 1: probe (parallel, no shared state besides the cache)
+            if use_ff:
+                probe_results = ffprobe_many(files, prefix="Analyzing: ")
+            else:
+                probe_results = [(None, None, None, None)] * len(files)
 
-                entries.append((SEVERITY.get(col, 9), col, label_text, tag, p.name, row))
+            # phase 2: classify + write CSV (single thread, deterministic)
+            out_csv = (Path.cwd() / "reports" / "quality_report.csv").resolve()
+            entries, counts = write_quality_report(files, probe_results, out_csv)
 
-            # sort worst -> best, then by filename
-            entries.sort(key=lambda x: (x[0], x[4].lower()))
+            # phase 3: sort worst -> best, then by filename, and print
+            entries.sort(key=itemgetter(0, 1))
 
-            # print report
-            for _, col, label_text, tag, name, _row in entries:
-                print(colorize(f"[{label_text:5}]", col), f"{tag} | {name}")
+            # print report (built up and written in one go; thousands of print() calls crawl on some terminals)
+            sys.stdout.write("".join(
+                f"{col}[{label_text:5}]{C_RESET} {tag} | {name}\n"
+                for _, _name_key, col, label_text, tag, name in entries
+            ))
 
             # footer
             total = len(entries)
@@ -621,11 +987,6 @@ def main():
                 f"{colorize('BLUE ' + str(counts.get('BLUE',0)), C_BLUE)} | "
             )
 
-            # rows for CSV
-            rows = [e[5] for e in entries]
-            out_csv = (Path.cwd() / "reports" / "quality_report.csv").resolve()
-            write_quality_csv(rows, out_csv)
-            last_quality_rows = rows
             input(f"\nQuality report written to: {out_csv}\n(enter)")
 
 
@@ -634,17 +995,20 @@ def main():
                 input("Set SOURCE first. (enter)")
                 continue
             files = collect_media(source)
-            dupes = group_duplicates_by_name_size(files)
+            dupes = group_duplicates(files)
             last_dupes = dupes
 
-            out_csv = (Path.cwd() / "reports" / "duplicates_name_size.csv").resolve()
+            csv_name = "duplicates_name_size.csv" if DUPE_MODE == "name" else "duplicates_sampled.csv"
+            out_csv = (Path.cwd() / "reports" / csv_name).resolve()
             out_csv.parent.mkdir(parents=True, exist_ok=True)
 
             with out_csv.open("w", newline="", encoding="utf-8") as f:
                 w = csv.writer(f)
                 w.writerow(["name", "size_bytes", "count", "paths"])
-                for (name, size), paths in sorted(dupes.items(), key=lambda x: x[0][0]):
-                    w.writerow([name, size, len(paths), " | ".join(str(p) for p in paths)])
+                w.writerows(
+                    [name, size, len(paths), " | ".join(paths)]
+                    for (name, size), paths in sorted(dupes.items(), key=itemgetter(0))
+                )
 
             input(f"Found {len(dupes)} duplicate groups.\nCSV: {out_csv}\n(enter)")
 
@@ -659,11 +1023,12 @@ def main():
                 input("Set SOURCE first. (enter)")
                 continue
             files = collect_media(source)
-            variants = group_variants_by_name(files)
+            sizes = {p: st.st_size for p, st in files}
+            variants = group_variants_by_name(sizes)
             last_variants = variants
 
             out_csv = (Path.cwd() / "reports" / "variants_by_name.csv").resolve()
-            write_variants_csv(variants, out_csv)
+            write_variants_csv(variants, sizes, out_csv)
 
             input(f"Found {len(variants)} variant groups.\nCSV: {out_csv}\n(enter)")
 
@@ -8,31 +8,56 @@ Menu-driven UI for easier navigation.
 """
 
 import csv
+import errno
 import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 import os
+import stat
 from typing import Iterator, Iterable, Set, List, Optional, Dict, Tuple
 import subprocess
 
+# the flags sudo_unlock clears (uchg / schg)
+IMMUTABLE_FLAGS = getattr(stat, "UF_IMMUTABLE", 0) | getattr(stat, "SF_IMMUTABLE", 0)
+
 def has_uchg(path: Path) -> bool:
-    """Detect macOS user immutable flag (uchg) via ls -lO output."""
+    """Detect the macOS immutable flags (uchg/schg) straight from lstat, no ls subprocess."""
     try:
-        out = subprocess.check_output(
-            ["ls", "-lO", str(path)],
-            text=True,
-            stderr=subprocess.DEVNULL
-        )
-        return "uchg" in out.split()
-    except Exception:
+        # st_flags only exists on BSD/macOS; elsewhere there's nothing to unlock
+        return bool(getattr(os.lstat(path), "st_flags", 0) & IMMUTABLE_FLAGS)
+    except OSError:
+        return False
+
+def clear_uchg(path: Path) -> bool:
+    """
+    Clear uchg with os.chflags ourselves; the file's owner doesn't need root for that.
+    Returns True if the file has no immutable flag left.
+    """
+    try:
+        flags = os.lstat(path).st_flags
+        if flags & getattr(stat, "SF_IMMUTABLE", 0):
+            return False  # schg really does need root
+        if flags & stat.UF_IMMUTABLE:
+            os.chflags(path, flags & ~stat.UF_IMMUTABLE, follow_symlinks=False)
+        return True
+    except (AttributeError, NotImplementedError, OSError):
+        # no st_flags / chflags here (non-mac), or not our file
         return False
 
 def sudo_unlock(path: Path) -> bool:
     """
-    Attempt to remove uchg/schg flags using sudo chflags.
+    Attempt to remove uchg/schg flags: natively first (plain uchg on our own file),
+    then with sudo chflags.
     Returns True if command ran successfully, False otherwise.
     """
+    if clear_uchg(path):
+        return True
     try:
         # This will prompt for sudo password in the terminal if needed.
         subprocess.check_call(["sudo", "chflags", "nouchg,noschg", str(path)])
@@ -44,211 +69,445 @@ def sudo_unlock(path: Path) -> bool:
         return False
 
 
-def walk_files(root: Path, *, ignore_dir_names: Iterable[str] = ()) -> Iterator[Path]:
+def scan_one_dir(path: str, ignore: Set[str]) -> Tuple[List[os.DirEntry], List[str]]:
+    """One directory's regular files and (non-ignored) subdirectory paths."""
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        # prune dirs we want to ignore (but DO NOT prune "looks-good" dirs)
+                        if e.name.lower() not in ignore:
+                            subdirs.append(e.path)
+                    elif e.is_file():
+                        files.append(e)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+def walk_entries_parallel(root: Path, *, ignore_dir_names: Iterable[str] = ()) -> Iterator[os.DirEntry]:
     """
-    Walk ALL nested dirs under root (top-down) and yield file Paths.
+    Walk ALL nested dirs under root and yield the DirEntry of every regular file.
     Only prunes directories whose name matches ignore_dir_names (case-insensitive).
+    The file/dir check comes from the scandir read itself, so callers don't need
+    their own is_file() (a stat per file).
+    Directories are read on a thread pool: scandir releases the GIL, so on NAS/SMB
+    shares (slow readdir round trips) many folders load at once. Order is
+    arbitrary; callers sort.
     """
-    root = Path(root)
     ignore: Set[str] = {n.lower() for n in ignore_dir_names}
 
-    for dirpath, dirnames, filenames in os.walk(root, topdown=True):
-        # prune dirs we want to ignore (but DO NOT prune "looks-good" dirs)
-        dirnames[:] = [d for d in dirnames if d.lower() not in ignore]
-
-        for fn in filenames:
-            yield Path(dirpath) / fn
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        pending = {ex.submit(scan_one_dir, str(root), ignore)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                files, subdirs = fut.result()
+                for d in subdirs:
+                    pending.add(ex.submit(scan_one_dir, d, ignore))
+                yield from files
 
 IGNORE_DIRS = {"BONUS_FEATURES", ".git", "__pycache__", "reports"}
 TRAILING_COPY_RE = re.compile(r"""\s*(?:\(\d+\)|\d+|copy|dup\d*)\s*$""", re.IGNORECASE)
-VALID_VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".m4v", ".mov", ".wmv", ".m2ts"}
-SIDECAR_EXTENSIONS = {".srt", ".ass", ".ssa", ".vtt", ".sub", ".idx", ".nfo"}
-MEDIA_EXTS = {e.lower() for e in VALID_VIDEO_EXTENSIONS}
-SIDECAR_EXTS = {e.lower() for e in SIDECAR_EXTENSIONS}
+VALID_VIDEO_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".m4v", ".mov", ".wmv", ".m2ts"})
+SIDECAR_EXTENSIONS = frozenset({".srt", ".ass", ".ssa", ".vtt", ".sub", ".idx", ".nfo"})
+MEDIA_EXTS = frozenset(e.lower() for e in VALID_VIDEO_EXTENSIONS)
+SIDECAR_EXTS = frozenset(e.lower() for e in SIDECAR_EXTENSIONS)
+ALL_EXTS = MEDIA_EXTS | SIDECAR_EXTS
+# tuple so str.endswith can test them all in one call
+MEDIA_SIDECAR_SUFFIXES = tuple(ALL_EXTS)
 BONUS_DIR_NAME = "BONUS_FEATURES" 
-KNOWN_JUNK_NAMES = {
+RENAME_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+SCAN_WORKERS = RENAME_WORKERS
+# matched against single lowercased tokens, so entries can't contain a PARSE_TOKEN
+# separator ("web-dl" arrives as "web" + "dl", "5.1" as "5" + "1")
+KNOWN_JUNK_NAMES = frozenset({
     "480p","720p","1080p","2160p","4k","uhd",
     "x264","x265","h264","h265","hevc",
     "bluray","bdrip","brrip","remux","web","webrip","webdl","hdrip","dvdrip","hdtv",
     "hdr","hdr10","hdr10+","dv","dolbyvision",
     "aac","ac3","eac3","dd","ddp","dts","dtshd","truehd","atmos",
-    "5.1","7.1","2.0",
     "yify","rarbg",
-    "unrated","proper","repack", "dl", "web-dl", "webrip", "hdrip", "brrip", "dvdrip",  
+    "unrated","proper","repack", "dl",
     "copy", "sample",
-    "jyk", "rarbg", "ettv", "evo"
-}
+    "jyk", "ettv", "evo"
+})
 
-PROPER_YEAR_FORMATS = re.compile(r"^(19\d{2}|20\d{2})$")
-PARSE_ON = re.compile(r"[.\-_\s\[\]\(\)\{\};:,]+")
+# a token is any run of chars that aren't separators (. - _ space brackets ; : ,)
+PARSE_TOKEN = re.compile(r"[^.\-_\s\[\]\(\)\{\};:,]+")
 CURRENT_YEAR = datetime.now().year
+CURRENT_YEAR_STR = str(CURRENT_YEAR)
 YEAR_IN_TOKEN = re.compile(r"(19\d{2}|20\d{2})")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RenameItem:
     original: Path
     proposed: Path
-    action: str   # rename_video / rename_sidecar
+    # rename_video / rename_sidecar, plus (include_noops only) noop_video / noop_sidecar /
+    # collision_skip / collision_skip_sidecar. Always one of these literals, so every item
+    # shares the same interned str objects; no sys.intern needed.
+    action: str
     title: str
     year: str
 
 def extract_year(tok: str) -> Optional[str]:
+    # most tokens are plain words; two substring checks are much cheaper than a regex search
+    if "19" not in tok and "20" not in tok:
+        return None
     m = YEAR_IN_TOKEN.search(tok)
     if not m:
         return None
-    y = int(m.group(1))
-    if 1900 <= y <= CURRENT_YEAR:
-        return m.group(1)
+    y = m.group(1)
+    # the match already starts with 19/20 so it's >= 1900; ascii digits compare fine as strings
+    if (y <= CURRENT_YEAR_STR) if y.isascii() else (int(y) <= CURRENT_YEAR):
+        return y
     return None
 
-def is_year(tok: str) -> bool:
-    if not PROPER_YEAR_FORMATS.match(tok):
-        return False
-    y = int(tok)
-    return 1900 <= y <= CURRENT_YEAR
-
-SPACE_RE = re.compile(r"\s+")
-
+# pure str -> str; menu rescans and the scan + plan passes ask about the same names again
+@lru_cache(maxsize=200_000)
 def normalized_name_for_ext(name: str) -> str:
     """
     Normalize filename so extension checks still work on 'file.mkv 2', 'file.mp4 (1)', etc.
     """
     n = name.strip()
     # If it ends with a normal extension already, fine
-    lower = n.lower()
-    for ext in MEDIA_EXTS | SIDECAR_EXTS:
-        if lower.endswith(ext):
-            return n
-    
+    if n.lower().endswith(MEDIA_SIDECAR_SUFFIXES):
+        return n
+
+    # TRAILING_COPY_RE can only match a name ending in ")", a digit or the y/p of
+    # copy/dup (n is stripped, no trailing space); anything else skips the regex
+    last = n[-1:]
+    if not last or not (last in ")yYpP" or last.isdecimal()):
+        return n
+
     # Otherwise try stripping trailing " 2", "(2)", "copy", "dup1", etc then re-check
     stripped = TRAILING_COPY_RE.sub("", n).strip()
-    lower2 = stripped.lower()
-    for ext in MEDIA_EXTS | SIDECAR_EXTS:
-        if lower2.endswith(ext):
-            return stripped
+    if stripped.lower().endswith(MEDIA_SIDECAR_SUFFIXES):
+        return stripped
 
     return n  # fallback (won't match)
 
 def iter_media_files(root: Path) -> List[Path]:
+    # check the bare entry name; only files that pass get a Path
+    exts = MEDIA_SIDECAR_SUFFIXES
     out: List[Path] = []
-    for p in walk_files(root, ignore_dir_names=IGNORE_DIRS):
-        if not p.is_file():
-            continue
-
-        nn = normalized_name_for_ext(p.name).lower()
-        if any(nn.endswith(ext) for ext in (MEDIA_EXTS | SIDECAR_EXTS)):
-            out.append(p)
+    for e in walk_entries_parallel(root, ignore_dir_names=IGNORE_DIRS):
+        if normalized_name_for_ext(e.name).lower().endswith(exts):
+            out.append(Path(e.path))
 
     return sorted(out)
 
 def normalize_spaces(s: str) -> str:
     """Collapse multiple spaces into one and strip ends."""
-    return SPACE_RE.sub(" ", s).strip()
+    # str.split() with no args splits on the same whitespace as \s and drops the ends,
+    # so this is the old re.sub(r"\s+", " ", s).strip() without the regex
+    return " ".join(s.split())
+
+ROMAN_CHARS = frozenset("ivxlcdm")
 
 def smart_title(tokens: List[str]) -> str:
-    out = []
-    for t in tokens:
-        if re.fullmatch(r"[ivxlcdm]+", t.lower()):
-            out.append(t.upper())
-        else:
-            out.append(t[:1].upper() + t[1:].lower() if t else t)
-    # collapse any accidental multi-space
-    return re.sub(r"\s+", " ", " ".join(out)).strip()
+    joined = " ".join(tokens)
+    words: List[str] = []
+    # plain ascii words (the usual case): one str.title() call does the casing in C.
+    # anything else (o'neil, 2fast, accents) keeps the per-token rule, str.title() differs there
+    if joined.isascii() and joined.replace(" ", "").isalpha():
+        words = joined.title().split(" ")
+    if len(words) != len(tokens):
+        words = [t[:1].upper() + t[1:].lower() if t else t for t in tokens]
 
-def is_same_file(a: Path, b: Path) -> bool:
+    out = []
+    for w in words:
+        low = w.lower()
+        # roman numeral (ii, iv, xiii...) -> all caps; set check instead of a regex per token
+        out.append(w.upper() if low and ROMAN_CHARS.issuperset(low) else w)
+    # collapse any accidental multi-space (e.g. from empty tokens)
+    return normalize_spaces(" ".join(out))
+
+# errnos Path.exists() treats as "not there" rather than raising
+MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+def file_id(p: Path) -> Optional[Tuple[int, int]]:
+    """(st_dev, st_ino) of p, or None wherever p.exists() would be False."""
     try:
-        return a.exists() and b.exists() and os.path.samefile(a, b)
-    except FileNotFoundError:
+        st = os.stat(p)
+    except OSError as e:
+        if e.errno in MISSING_ERRNOS:
+            return None
+        raise
+    return st.st_dev, st.st_ino
+
+def is_same_file(a: Path, b: Path, b_id: Optional[Tuple[int, int]] = None) -> bool:
+    # samefile stats both paths itself; a missing one raises, so no exists() pre-checks.
+    # b_id is b's file_id when the caller already statted it; then only a gets a stat
+    try:
+        if b_id is not None:
+            st = os.stat(a)
+            return (st.st_dev, st.st_ino) == b_id
+        return os.path.samefile(a, b)
+    except (FileNotFoundError, NotADirectoryError):
         return False
     except OSError:
         # safe fallback (not perfect across mounts)
         return a.resolve() == b.resolve()
 
+# pure function of the stem; rescans from the menu hit the cache instead of re-parsing
+@lru_cache(maxsize=200_000)
 def parse_base_name(stem: str) -> tuple[str, Optional[str]]:
-    raw_tokens = [t for t in PARSE_ON.split(stem) if t]
     title_tokens: List[str] = []
     year: Optional[str] = None
 
-    for tok in raw_tokens:
-        low = tok.lower()
+    # globals bound to locals once; the loop below runs for every token of every file
+    junk_names = KNOWN_JUNK_NAMES
+    year_of = extract_year
+
+    # both token lists come out of the C regex engine in one call each, and the stem is
+    # lowercased once instead of every token separately (lowering never adds/removes separators)
+    tokens = PARSE_TOKEN.findall(stem)
+    lowers = PARSE_TOKEN.findall(stem.lower())
+    if len(lowers) != len(tokens):
+        lowers = [t.lower() for t in tokens]
+
+    # a year only counts once the title has started, and only if "19"/"20" shows up
+    # somewhere in the stem; one scan here saves the per-token check on most names
+    may_have_year = "19" in stem or "20" in stem
+
+    for tok, low in zip(tokens, lowers):
+        # title hasn't started: junk is dropped, anything else starts it (years included)
+        if not title_tokens:
+            if low not in junk_names:
+                title_tokens.append(tok)
+            continue
 
         # skip junk after title has started
-        if low in KNOWN_JUNK_NAMES and title_tokens:
+        if low in junk_names:
             continue
 
-        y = extract_year(tok)
-        if y and title_tokens:
-            year = y
-            break
+        if may_have_year:
+            y = year_of(tok)
+            if y:
+                year = y
+                break
 
-        if low not in KNOWN_JUNK_NAMES:
-            title_tokens.append(tok)
+        title_tokens.append(tok)
 
     title = smart_title(title_tokens) if title_tokens else stem
     return title, year
 
+def name_stem(name: str) -> str:
+    """Path(name).stem for a bare file name, without building a Path."""
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+@lru_cache(maxsize=200_000)
+def base_name_parts(stem: str) -> Tuple[str, Optional[str], str]:
+    """(title, year, new base name) for a stem, e.g. ("Dune", "2021", "Dune (2021)"); cached across scans."""
+    title, year = parse_base_name(stem)
+    return title, year, f"{title} ({year})" if year else title
+
+def parse_base_names(stems: Iterable[str]) -> Dict[str, Tuple[str, Optional[str], str]]:
+    """Parse a batch of stems, each distinct stem only once (copies/dups share stems)."""
+    out: Dict[str, Tuple[str, Optional[str], str]] = {}
+    for stem in stems:
+        if stem not in out:
+            out[stem] = base_name_parts(stem)
+    return out
+
 
 def iter_files_for_rename(root: Path) -> list[Path]:
-    out: list[Path] = []
-    for p in walk_files(root, ignore_dir_names=IGNORE_DIRS):
-        if p.is_file():
-            out.append(p)
-    return sorted(out)
+    # same threaded scandir walk as iter_media_files / iter_video_files
+    return sorted(Path(e.path) for e in walk_entries_parallel(root, ignore_dir_names=IGNORE_DIRS))
+
 
+BONUS_NAME_LOWER = BONUS_DIR_NAME.lower()
 
+@lru_cache(maxsize=65_536)
 def is_in_bonus_features(path: Path) -> bool:
-    return any(part.lower() == BONUS_DIR_NAME.lower() for part in path.parts)
+    # walk up the parent chain; cached per directory, so siblings (and their
+    # subfolders) reuse the answer for the part of the chain they share
+    if path.name.lower() == BONUS_NAME_LOWER:
+        return True
+    parent = path.parent
+    return parent != path and is_in_bonus_features(parent)
 
 
 def key_path(p: Path) -> str:
     # case-insensitive key good for macOS default volumes
     return str(p).casefold()
 
-def resolve_collision(target: Path, reserved: set[str]) -> Path:
-    if (not target.exists()) and (key_path(target) not in reserved):
-        reserved.add(key_path(target))
+@lru_cache(maxsize=65_536)
+def dir_key(parent: Path) -> str:
+    # key_path prefix for anything directly inside parent, folded once per folder.
+    # casefold maps char by char, so dir_key(parent) + name.casefold() == key_path(parent / name)
+    return key_path(parent / "x")[:-1]
+
+def child_key(parent: Path, name: str) -> str:
+    """key_path(parent / name) without re-folding the whole directory part."""
+    return dir_key(parent) + name.casefold()
+
+def scan_folder(parent: Path) -> List[Tuple[str, bool]]:
+    """(name, is_file) for everything directly inside parent, straight from one scandir."""
+    out: List[Tuple[str, bool]] = []
+    try:
+        with os.scandir(parent) as it:
+            for e in it:
+                try:
+                    out.append((e.name, e.is_file()))
+                except OSError:
+                    out.append((e.name, False))
+    except OSError:
+        pass
+    return out
+
+def name_key(name: str) -> str:
+    # loose match key: case-insensitive and NFC/NFD-insensitive like macOS volumes
+    return unicodedata.normalize("NFC", name).casefold()
+
+def folder_ignores_case(parent: Path, entries: List[Tuple[str, bool]]) -> bool:
+    """
+    Whether exists() in parent ignores case (default macOS volumes) or not (Linux,
+    most NAS shares). One lstat: a listed name, asked for in the other case.
+    No name with letters to try -> case can't matter for this folder's names anyway.
+    """
+    names = {name for name, _ in entries}
+    for name, _ in entries:
+        other = name.swapcase()
+        if other != name and other.swapcase() == name and other not in names:
+            try:
+                os.lstat(os.path.join(parent, other))
+            except OSError:
+                return False
+            return True
+    return False
+
+def disk_names(parent: Path, entries: Optional[List[Tuple[str, bool]]] = None) -> Tuple[bool, Set[str]]:
+    """
+    (ignores_case, names) for what's already in parent, so resolve_collision can
+    answer exists() from one listing: names are casefolded when the volume
+    ignores case, exact otherwise.
+    """
+    if entries is None:
+        entries = scan_folder(parent)
+    if folder_ignores_case(parent, entries):
+        return True, {name.casefold() for name, _ in entries}
+    return False, {name for name, _ in entries}
+
+def resolve_collision(target: Path, reserved: set[str], dup_next: Optional[Dict[str, int]] = None,
+                      on_disk: Optional[Tuple[bool, Set[str]]] = None) -> Path:
+    """
+    First free name among target, 'name - dup1.ext', 'name - dup2.ext', ...
+    A name is taken if it's claimed earlier in the plan (reserved, casefolded keys)
+    or already exists in the folder (on_disk, from disk_names(target.parent));
+    the winner gets added to reserved.
+    dup_next (target key -> next dup number to try) lets repeat collisions on the
+    same target pick up where the last one stopped instead of probing from dup1.
+    """
+    ignores_case, names = on_disk if on_disk is not None else (False, ())
+    prefix = dir_key(target.parent)
+    name = target.name
+    target_key = prefix + name.casefold()
+    if target_key not in reserved and (name.casefold() if ignores_case else name) not in names:
+        reserved.add(target_key)
         return target
 
-    base = target.with_suffix("")
+    # candidates stay plain names; only the winner becomes a Path
+    stem = target.stem
     ext = target.suffix
-    for i in range(1, 1000):
-        cand = Path(f"{base} - dup{i}{ext}")
-        if (not cand.exists()) and (key_path(cand) not in reserved):
-            reserved.add(key_path(cand))
-            return cand
+    # reserved only grows (and the disk listing doesn't change), so every number
+    # below the saved one is still taken
+    start = dup_next.get(target_key, 1) if dup_next is not None else 1
+    for i in range(start, 1000):
+        cand = f"{stem} - dup{i}{ext}"
+        folded = cand.casefold()
+        key = prefix + folded
+        if key not in reserved and (folded if ignores_case else cand) not in names:
+            reserved.add(key)
+            if dup_next is not None:
+                dup_next[target_key] = i + 1
+            return target.with_name(cand)
 
     raise RuntimeError(f"Too many collisions for {target}")
 
 
 
-def find_sidecars(video_file: Path) -> List[Path]:
-    parent = video_file.parent
-    stem = Path(normalized_name_for_ext(video_file.name)).stem
-    out: List[Path] = []
-
-    for p in parent.iterdir():
-        if not p.is_file():
-            continue
-        if is_in_bonus_features(p):
-            continue
-        if not p.name.startswith(stem):
-            continue
+# any sidecar ext appearing in a (lowercased) name; one C-level scan instead of an `in` per ext
+SIDECAR_EXT_ANYWHERE = re.compile("|".join(re.escape(e) for e in sorted(SIDECAR_EXTS)))
 
-        suffixes = [s.lower() for s in p.suffixes]
-        if any(s in SIDECAR_EXTENSIONS for s in suffixes):
-            out.append(p)
+def has_sidecar_suffix(name: str) -> bool:
+    """True if any of the name's suffixes (Path.suffixes) is a sidecar extension."""
+    low = name.lower()
+    dot = low.rfind(".")
+    # usual case: the last suffix is the sidecar ext (.srt, .eng.srt, ...), no list of suffixes needed.
+    # the strip check mirrors Path.suffixes ignoring leading dots
+    if low[dot:] in SIDECAR_EXTS and low[:dot].strip("."):
+        return True
+    # rare: ext earlier in the name (movie.srt.bak); only split it up if the text is there at all
+    if not SIDECAR_EXT_ANYWHERE.search(low):
+        return False
+    return any(s.lower() in SIDECAR_EXTS for s in Path(name).suffixes)
 
+def sidecar_index(parent: Path, entries: Optional[List[Tuple[str, bool]]] = None) -> List[str]:
+    """
+    Sorted names of the sidecar files directly inside parent.
+    Built once per folder; every video in that folder then finds its sidecars
+    with a binary search instead of re-listing the directory.
+    """
+    if is_in_bonus_features(parent):
+        return []
+    if entries is None:
+        entries = scan_folder(parent)
+    names = [name for name, is_file in entries if is_file and has_sidecar_suffix(name)]
+    names.sort()
+    return names
+
+# sorts after any real filename char; stem + PREFIX_END bounds every name starting with stem
+PREFIX_END = chr(0x10FFFF)
+
+def prefix_matches(index: List[str], stem: str) -> List[str]:
+    # names sharing a prefix sit next to each other in sorted order, so the matches
+    # are one slice bounded by two bisects (no startswith per candidate)
+    lo = bisect_left(index, stem)
+    hi = bisect_right(index, stem + PREFIX_END, lo)
+    return index[lo:hi]
+
+def group_sidecars(index: List[str], stems: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Hand every sidecar name in one folder's index to the video stem it belongs to.
+    Longest stem wins, so 'Movie.2010.x264.srt' goes to 'Movie.2010.x264' and not
+    also to a 'Movie' sitting in the same folder.
+    """
+    uniq = set(stems)
+    # usual movie folder: one video (or no sidecars at all), nothing to arbitrate
+    if len(uniq) == 1 or not index:
+        return {stem: prefix_matches(index, stem) for stem in uniq}
+
+    claimed: Set[str] = set()
+    out: Dict[str, List[str]] = {}
+    for stem in sorted(uniq, key=len, reverse=True):
+        names = [n for n in prefix_matches(index, stem) if n not in claimed]
+        claimed.update(names)
+        out[stem] = names
     return out
 
+def is_video_name(name: str) -> bool:
+    """Path(name).suffix.lower() in VALID_VIDEO_EXTENSIONS, on the bare string."""
+    dot = name.rfind(".")
+    # dot > 0 matches Path.suffix (a leading-dot name like ".mkv" has no suffix)
+    return dot > 0 and name[dot:].lower() in VALID_VIDEO_EXTENSIONS
+
 def iter_video_files(root: Path) -> List[Path]:
     """
     Recursively find video files under root, respecting IGNORE_DIRS.
     """
+    # filter on the plain name string and only build a Path for actual videos
     out: List[Path] = []
-    for p in walk_files(root, ignore_dir_names=IGNORE_DIRS):
-        if p.is_file() and p.suffix.lower() in VALID_VIDEO_EXTENSIONS:
-            out.append(p)
+    for e in walk_entries_parallel(root, ignore_dir_names=IGNORE_DIRS):
+        if is_video_name(e.name):
+            out.append(Path(e.path))
     return sorted(out)
 
 
@@ -259,138 +518,182 @@ def build_rename_plan(video_files: List[Path], include_noops: bool = False) -> L
     # Reserve targets during planning so two files in the same scan
     # don't both choose the same proposed name.
     reserved: set[str] = set()
-
-    def key_path(p: Path) -> str:
-        # macOS default volumes are usually case-insensitive
-        return str(p).casefold()
-
-    def resolve_collision_reserved(target: Path) -> Path:
-        # If nothing exists on disk AND we haven't already claimed it in this plan, use it.
-        if (not target.exists()) and (key_path(target) not in reserved):
-            reserved.add(key_path(target))
-            return target
-
-        base = target.with_suffix("")
-        ext = target.suffix
-        for i in range(1, 1000):
-            cand = Path(f"{base} - dup{i}{ext}")
-            if (not cand.exists()) and (key_path(cand) not in reserved):
-                reserved.add(key_path(cand))
-                return cand
-
-        raise RuntimeError(f"Too many collisions for {target}")
-
-    for vid in video_files:
-        norm_name = normalized_name_for_ext(vid.name)
-        norm_path = Path(norm_name)
-
-        # parse based on normalized stem (handles Transformers.Age.of... and mkv 2 cases)
-        title, year = parse_base_name(norm_path.stem)
-        new_base = f"{title} ({year})" if year else title
+    # parent dir -> {video stem: its sidecar names}, built once per folder
+    sidecar_groups: Dict[Path, Dict[str, List[str]]] = {}
+
+    # collided target key -> next dup number to try for it
+    dup_next: Dict[str, int] = {}
+
+    # parent dir -> disk_names() of it, for the collision checks
+    on_disk: Dict[Path, Tuple[bool, Set[str]]] = {}
+
+    # one scandir per folder, shared by the collision snapshot, the sidecar index and
+    # the exists() prefilter below
+    folder_entries: Dict[Path, List[Tuple[str, bool]]] = {}
+    folder_keys: Dict[Path, Set[str]] = {}
+
+    def entries_of(parent: Path) -> List[Tuple[str, bool]]:
+        entries = folder_entries.get(parent)
+        if entries is None:
+            entries = folder_entries[parent] = scan_folder(parent)
+            folder_keys[parent] = {name_key(name) for name, _ in entries}
+        return entries
+
+    # parse based on normalized stem (handles Transformers.Age.of... and mkv 2 cases);
+    # done as one batch up front, the stem is reused for the sidecar lookup below
+    norm_names = [normalized_name_for_ext(vid.name) for vid in video_files]
+    norm_stems = [name_stem(n) for n in norm_names]
+    parsed = parse_base_names(norm_stems)
+
+    # a new Path on every .parent access, so grab them once
+    parents = [vid.parent for vid in video_files]
+
+    # list every folder up front on a thread pool: scandir drops the GIL, so on slow or
+    # network volumes the listings overlap instead of going one folder at a time.
+    # Nothing changes on disk while planning, so listing early sees the same contents.
+    uniq_parents = list(dict.fromkeys(parents))
+    if len(uniq_parents) > 1:
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(uniq_parents))) as ex:
+            for parent, entries in zip(uniq_parents, ex.map(scan_folder, uniq_parents)):
+                folder_entries[parent] = entries
+                folder_keys[parent] = {name_key(name) for name, _ in entries}
+    # only real videos can own sidecars (the menu scan passes sidecars in here too)
+    stems_by_parent: Dict[Path, List[str]] = {}
+    for parent, norm_name, stem in zip(parents, norm_names, norm_stems):
+        if norm_name[len(stem):].lower() in MEDIA_EXTS:
+            stems_by_parent.setdefault(parent, []).append(stem)
+
+    for vid, parent, norm_name, video_stem_norm in zip(video_files, parents, norm_names, norm_stems):
+        title, year, new_base = parsed[video_stem_norm]
 
         # use normalized suffixes (handles .eng.srt etc)
         effective_suffix = effective_extension_from_name(norm_name)
-        proposed_vid = vid.with_name(new_base + effective_suffix)
-
+        new_vid_name = new_base + effective_suffix
+        proposed_vid = vid.with_name(new_vid_name)
+        year_str = year or ""
+
+        # stat the target once; the checks below all reuse it. A name that isn't in the
+        # folder listing (even loosely) can't exist, so most targets skip the stat entirely.
+        # The (dev, ino) from that one stat also answers same-file, so no samefile() re-stat
+        entries_of(parent)
+        target_id = file_id(proposed_vid) if name_key(new_vid_name) in folder_keys[parent] else None
+        target_exists = target_id is not None
+        same_file = target_exists and is_same_file(vid, proposed_vid, target_id)
 
         # If the proposed path "exists" but it's actually the same file
         # (common on case-insensitive filesystems), treat as NOOP.
-        if proposed_vid.exists() and is_same_file(vid, proposed_vid):
+        if same_file:
             if include_noops:
                 plan.append(RenameItem(
                     original=vid,
                     proposed=proposed_vid,
                     action="noop_video",
                     title=title,
-                    year=year or ""
+                    year=year_str
                 ))
             # still reserve it so nothing else plans to rename into it
-            reserved.add(key_path(proposed_vid))
+            reserved.add(child_key(parent, new_vid_name))
             continue
 
         # If name is already exactly the same, it's a NOOP.
-        if proposed_vid.name == vid.name:
+        if new_vid_name == vid.name:
             if include_noops:
                 plan.append(RenameItem(
                     original=vid,
                     proposed=proposed_vid,
                     action="noop_video",
                     title=title,
-                    year=year or ""
+                    year=year_str
                 ))
-            reserved.add(key_path(proposed_vid))
+            reserved.add(child_key(parent, new_vid_name))
             continue
 
         # If a DIFFERENT file already occupies the desired target, decide what you want to do.
         # Option A (recommended): SKIP and report it, instead of auto-dup'ing silently.
-        if proposed_vid.exists() and not is_same_file(vid, proposed_vid):
+        if target_exists and not same_file:
             if include_noops:
                 plan.append(RenameItem(
                     original=vid,
                     proposed=proposed_vid,
                     action="collision_skip",
                     title=title,
-                    year=year or ""
+                    year=year_str
                 ))
             # reserve anyway so we don't create a pile of dup targets around it
-            reserved.add(key_path(proposed_vid))
+            reserved.add(child_key(parent, new_vid_name))
             continue
 
         # Otherwise: reserve-aware collision resolution (disk + in-plan)
-        proposed_vid = resolve_collision_reserved(proposed_vid)
+        parent_on_disk = on_disk.get(parent)
+        if parent_on_disk is None:
+            parent_on_disk = on_disk[parent] = disk_names(parent, entries_of(parent))
+        proposed_vid = resolve_collision(proposed_vid, reserved, dup_next, parent_on_disk)
 
         plan.append(RenameItem(
             original=vid,
             proposed=proposed_vid,
             action="rename_video",
             title=title,
-            year=year or ""
+            year=year_str
         ))
 
-        # Sidecars: keep pairing and use the SAME reserved collision logic
-        for sc in find_sidecars(vid):
-            video_stem_norm = Path(normalized_name_for_ext(vid.name)).stem
-            tail = sc.name[len(video_stem_norm):]
+        # Sidecars: keep pairing and use the SAME reserved collision logic.
+        # The folder is listed once and each sidecar goes to a single video (longest stem)
+        groups = sidecar_groups.get(parent)
+        if groups is None:
+            # folders with no real video (only sidecars passed in) own nothing, so skip the
+            # index and its bonus-folder check; otherwise both happen once per folder here
+            stems = stems_by_parent.get(parent)
+            groups = sidecar_groups[parent] = group_sidecars(sidecar_index(parent, entries_of(parent)), stems) if stems else {}
+
+        for sc_name in groups.get(video_stem_norm, ()):
+            # names are compared as strings; Paths only for what goes into the plan
+            sc = parent / sc_name
+            new_sc_name = new_base + sc_name[len(video_stem_norm):]
+
+            if new_sc_name == sc_name:
+                reserved.add(child_key(parent, sc_name))
+                continue
 
-            proposed_sc = sc.with_name(new_base + tail)
+            proposed_sc = sc.with_name(new_sc_name)
 
-            if proposed_sc.name == sc.name:
-                reserved.add(key_path(proposed_sc))
-                continue
+            sc_target_id = file_id(proposed_sc) if name_key(new_sc_name) in folder_keys[parent] else None
+            sc_target_exists = sc_target_id is not None
+            sc_same_file = sc_target_exists and is_same_file(sc, proposed_sc, sc_target_id)
 
-            if proposed_sc.exists() and is_same_file(sc, proposed_sc):
-                reserved.add(key_path(proposed_sc))
+            if sc_same_file:
+                reserved.add(child_key(parent, new_sc_name))
                 if include_noops:
                     plan.append(RenameItem(
                         original=sc,
                         proposed=proposed_sc,
                         action="noop_sidecar",
                         title=title,
-                        year=year or ""
+                        year=year_str
                     ))
                 continue
 
             # If a different file already exists at the target name, skip (don’t dup silently)
-            if proposed_sc.exists() and not is_same_file(sc, proposed_sc):
+            if sc_target_exists and not sc_same_file:
                 if include_noops:
                     plan.append(RenameItem(
                         original=sc,
                         proposed=proposed_sc,
                         action="collision_skip_sidecar",
                         title=title,
-                        year=year or ""
+                        year=year_str
                     ))
-                reserved.add(key_path(proposed_sc))
+                reserved.add(child_key(parent, new_sc_name))
                 continue
 
-            proposed_sc = resolve_collision_reserved(proposed_sc)
+            proposed_sc = resolve_collision(proposed_sc, reserved, dup_next, parent_on_disk)
 
             plan.append(RenameItem(
                 original=sc,
                 proposed=proposed_sc,
                 action="rename_sidecar",
                 title=title,
-                year=year or ""
+                year=year_str
             ))
 
     return plan
@@ -403,93 +706,126 @@ def effective_extension_from_name(name: str) -> str:
     """
     lower = name.lower().strip()
 
-    # prefer longest matches first (handles .eng.srt, .en.srt, etc)
-    candidates = sorted((MEDIA_EXTS | SIDECAR_EXTS), key=len, reverse=True)
-
-    for ext in candidates:
-        if lower.endswith(ext):
-            return ext
+    # every known ext is a single ".xxx", so a name ending in one has it right after
+    # its last dot: one slice + set lookup instead of sorting/scanning the ext list
+    ext = lower[lower.rfind("."):]
+    if ext in ALL_EXTS:
+        return ext
     return Path(name).suffix.lower()  # fallback
 
+PLAN_CSV_FIELDS = ("action", "original", "proposed", "title", "year")
+plan_csv_row = attrgetter(*PLAN_CSV_FIELDS)
+
 def write_plan_csv(plan: List[RenameItem], csv_path: Path) -> None:
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
+    with csv_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         w = csv.writer(f)
-        w.writerow(["action", "original", "proposed", "title", "year"])
-        for item in plan:
-            w.writerow([item.action, str(item.original), str(item.proposed), item.title, item.year])
-
+        w.writerow(PLAN_CSV_FIELDS)
+        # one writerows call over rows built by attrgetter, so there's no Python-level code
+        # per item at all; csv str()s the Paths itself (same text as os.fspath)
+        w.writerows(map(plan_csv_row, plan))
 
-def apply_plan(plan: List[RenameItem]) -> None:
-    sidecars = [x for x in plan if x.action == "rename_sidecar"]
-    videos   = [x for x in plan if x.action == "rename_video"]
-
-    auto_unlock = False  # if True, we will run sudo_unlock automatically on locked files
-
-    for item in sidecars + videos:
-        while True:
-            try:
-                item.original.rename(item.proposed)
-                break  # success → next file
 
-            except PermissionError:
-                locked = has_uchg(item.original)
-
-                print("\nPermissionError while renaming:")
-                print(f"  FROM: {item.original}")
-                print(f"  TO:   {item.proposed}")
-                print(f"  Immutable (uchg): {locked}")
-
-                # If it's locked and auto-unlock is enabled, try it immediately.
-                if locked and auto_unlock:
-                    print("\nAuto-unlock enabled → running: sudo chflags nouchg,noschg ...")
-                    ok = sudo_unlock(item.original)
-                    if ok and not has_uchg(item.original):
-                        print("Unlocked. Retrying rename...\n")
-                        continue
-                    print("Auto-unlock failed (or still locked). Falling back to prompt.\n")
+def try_rename(src: str, dst: str) -> bool:
+    try:
+        os.replace(src, dst)
+        return True
+    except Exception:
+        return False
 
-                print("\nOptions:")
-                print("  [Enter]  retry rename (after you fix it)")
-                print("  s        skip this file")
-                print("  q        quit apply")
-                if locked:
-                    print("  u        run sudo chflags nouchg,noschg on this file, then retry")
-                    print("  U        enable auto-unlock for ALL locked files this run")
+def split_plan(plan: List[RenameItem]) -> Tuple[List[RenameItem], List[RenameItem]]:
+    """(sidecar renames, video renames) in one pass over the plan; noop/skip rows are dropped."""
+    sidecars: List[RenameItem] = []
+    videos: List[RenameItem] = []
+    for x in plan:
+        if x.action == "rename_sidecar":
+            sidecars.append(x)
+        elif x.action == "rename_video":
+            videos.append(x)
+    return sidecars, videos
 
-                choice = input("> ").strip()
+def apply_plan(plan: List[RenameItem]) -> None:
+    sidecars, videos = split_plan(plan)
 
-                if choice.lower() == "s":
-                    print("→ Skipped\n")
-                    break
+    auto_unlock = False  # if True, we will run sudo_unlock automatically on locked files
 
-                if choice.lower() == "q":
-                    print("Aborting apply.")
-                    return
-
-                if locked and choice == "u":
-                    print("\nRunning sudo unlock...")
-                    ok = sudo_unlock(item.original)
-                    if not ok:
-                        print("Unlock command failed/cancelled. (maybe wrong password or no sudo rights)")
-                        continue
-                    if has_uchg(item.original):
-                        print("Still appears locked (uchg still set). Fix manually and press Enter to retry.")
-                        continue
-                    print("Unlocked. Retrying rename...\n")
+    # rename() is a plain syscall that drops the GIL, so each batch goes through a
+    # thread pool first (sidecars still all finish before any video). Anything that
+    # fails falls through to the interactive retry/unlock loop below, one at a time.
+    # One pool serves both batches; workers get plain (src, dst) strings pulled out up front.
+    with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as ex:
+        for batch in (sidecars, videos):
+            srcs = [os.fspath(x.original) for x in batch]
+            dsts = [os.fspath(x.proposed) for x in batch]
+            renamed = list(ex.map(try_rename, srcs, dsts))
+
+            for item, ok_first in zip(batch, renamed):
+                if ok_first:
                     continue
 
-                if locked and choice == "U":
-                    auto_unlock = True
-                    print("Auto-unlock enabled for this run. Retrying rename...\n")
-                    continue
+                while True:
+                    try:
+                        os.replace(item.original, item.proposed)
+                        break  # success → next file
+
+                    except PermissionError:
+                        locked = has_uchg(item.original)
+
+                        print("\nPermissionError while renaming:")
+                        print(f"  FROM: {item.original}")
+                        print(f"  TO:   {item.proposed}")
+                        print(f"  Immutable (uchg): {locked}")
+
+                        # If it's locked and auto-unlock is enabled, try it immediately.
+                        if locked and auto_unlock:
+                            print("\nAuto-unlock enabled → running: sudo chflags nouchg,noschg ...")
+                            ok = sudo_unlock(item.original)
+                            if ok and not has_uchg(item.original):
+                                print("Unlocked. Retrying rename...\n")
+                                continue
+                            print("Auto-unlock failed (or still locked). Falling back to prompt.\n")
+
+                        print("\nOptions:")
+                        print("  [Enter]  retry rename (after you fix it)")
+                        print("  s        skip this file")
+                        print("  q        quit apply")
+                        if locked:
+                            print("  u        run sudo chflags nouchg,noschg on this file, then retry")
+                            print("  U        enable auto-unlock for ALL locked files this run")
+
+                        choice = input("> ").strip()
+
+                        if choice.lower() == "s":
+                            print("→ Skipped\n")
+                            break
+
+                        if choice.lower() == "q":
+                            print("Aborting apply.")
+                            return
+
+                        if locked and choice == "u":
+                            print("\nRunning sudo unlock...")
+                            ok = sudo_unlock(item.original)
+                            if not ok:
+                                print("Unlock command failed/cancelled. (maybe wrong password or no sudo rights)")
+                                continue
+                            if has_uchg(item.original):
+                                print("Still appears locked (uchg still set). Fix manually and press Enter to retry.")
+                                continue
+                            print("Unlocked. Retrying rename...\n")
+                            continue
 
-                # Enter (or anything else) → just retry
-                print("Retrying...\n")
+                        if locked and choice == "U":
+                            auto_unlock = True
+                            print("Auto-unlock enabled for this run. Retrying rename...\n")
+                            continue
 
-            except Exception as e:
-                print(f"\nUnexpected error on {item.original}: {e}")
-                print("Skipping.\n")
-                break
+                        # Enter (or anything else) → just retry
+                        print("Retrying...\n")
+
+                    except Exception as e:
+                        print(f"\nUnexpected error on {item.original}: {e}")
+                        print("Skipping.\n")
+                        break
 
 
 
@@ -500,26 +836,28 @@ import shutil
 import subprocess
 
 def build_plan_preview(plan: List[RenameItem]) -> str:
-    lines = []
-    for i, item in enumerate(plan, start=1):
-        lines.append(f"{i:5d}. {item.action:13s}  {item.original.name}  ->  {item.proposed.name}")
-    return "\n".join(lines)
+    # same rows-in-one-go approach as write_plan_csv: a single join, no append per item
+    return "\n".join(
+        f"{i:5d}. {item.action:13s}  {item.original.name}  ->  {item.proposed.name}"
+        for i, item in enumerate(plan, start=1)
+    )
+
+@lru_cache(maxsize=1)
+def default_pager() -> str:
+    # Prefer less if available, else more, else none; looked up on PATH once per run
+    # instead of on every preview
+    if shutil.which("less"):
+        return "less -R"
+    if shutil.which("more"):
+        return "more"
+    return ""
 
 def show_in_pager(text: str) -> None:
     """
     Show text in a pager like `less`, similar to `man`.
     Falls back to printing if no pager exists.
     """
-    pager = os.environ.get("PAGER")
-
-    if not pager:
-        # Prefer less if available, else more, else None
-        if shutil.which("less"):
-            pager = "less -R"
-        elif shutil.which("more"):
-            pager = "more"
-        else:
-            pager = ""
+    pager = os.environ.get("PAGER") or default_pager()
 
     if not pager:
         print(text)
@@ -561,25 +899,70 @@ def count_dir_stats(dirpath: Path) -> tuple[int, int]:
     videos = 0
 
     try:
-        it = list(dirpath.iterdir())
+        it = os.scandir(dirpath)
     except PermissionError:
         return 0, 0
     except FileNotFoundError:
         return 0, 0
 
-    for p in it:
-        try:
-            if p.is_dir():
-                subdirs += 1
-            elif p.is_file() and p.suffix.lower() in VALID_VIDEO_EXTENSIONS:
-                videos += 1
-        except PermissionError:
-            # Some entries inside might also be protected
-            continue
+    # DirEntry knows its type from the directory read, so no stat per child
+    with it:
+        for e in it:
+            try:
+                if e.is_dir():
+                    subdirs += 1
+                elif is_video_name(e.name) and e.is_file():
+                    videos += 1
+            except PermissionError:
+                # Some entries inside might also be protected
+                continue
 
     return subdirs, videos
 
 
+def mtime_ns_of(p: Path) -> int:
+    try:
+        return p.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+@lru_cache(maxsize=128)
+def list_subdirs(cwd: Path, mtime_ns: int) -> Tuple[Path, ...]:
+    """
+    Every folder directly inside cwd.
+    mtime_ns is only part of the cache key: adding/removing entries in cwd changes it
+    and forces a relist.
+    """
+    dirs: List[Path] = []
+    try:
+        with os.scandir(cwd) as it:
+            for e in it:
+                try:
+                    if e.is_dir():
+                        dirs.append(Path(e.path))
+                except PermissionError:
+                    continue
+    except PermissionError:
+        dirs = []
+    return tuple(dirs)
+
+@lru_cache(maxsize=4096)
+def cached_dir_stats(d: Path, mtime_ns: int) -> tuple[int, int]:
+    # same trick per subfolder: count_dir_stats is non-recursive, so d's own mtime
+    # moves exactly when its counts can
+    return count_dir_stats(d)
+
+def folder_listing(cwd: Path) -> Tuple[Tuple[Path, int, int], ...]:
+    """
+    (subdir, subdir_count, video_count) for every folder directly inside cwd.
+    Menu redraws reuse cwd's listing while its mtime holds, and only recount a
+    subfolder whose own mtime moved.
+    """
+    return tuple(
+        (d, *cached_dir_stats(d, mtime_ns_of(d)))
+        for d in list_subdirs(cwd, mtime_ns_of(cwd))
+    )
 
 
 def interactive_menu(start_dir: Path) -> None:
@@ -595,23 +978,14 @@ def interactive_menu(start_dir: Path) -> None:
 
         if choice == "1":
             while True:
-                dirs = []
-                try:
-                    for p in cwd.iterdir():
-                        try:
-                            if p.is_dir():
-                                dirs.append(p)
-                        except PermissionError:
-                            continue
-                except PermissionError:
-                    dirs = []
+                listing = folder_listing(cwd)
+                dirs = [d for d, _, _ in listing]
 
 
                 print("\nFolders:")
                 print("  0) .. (Go to parent directory/folder)")
 
-                for i, d in enumerate(dirs, start=1):
-                    subdir_count, video_count = count_dir_stats(d)
+                for i, (d, subdir_count, video_count) in enumerate(listing, start=1):
                     print(
                         f"  {i}) {d.name}/ "
                         f"[{subdir_count} dirs | {video_count} videos]"
@@ -626,6 +1000,8 @@ def interactive_menu(start_dir: Path) -> None:
                 if sel.lower() == "b":
                     break
                 if sel == "r":
+                    list_subdirs.cache_clear()
+                    cached_dir_stats.cache_clear()
                     continue
                 if sel == "0":
                     parent = cwd.parent
@@ -652,21 +1028,11 @@ def interactive_menu(start_dir: Path) -> None:
         elif choice == "2":
     
             while True:
-                dirs = []
-                try:
-                    for p in cwd.iterdir():
-                        try:
-                            if p.is_dir():
-                                dirs.append(p)
-                        except PermissionError:
-                            continue
-                except PermissionError:
-                    dirs = []
+                listing = folder_listing(cwd)
 
 
                 print("\nFolders:")
-                for i, d in enumerate(dirs, start=1):
-                    subdir_count, video_count = count_dir_stats(d)
+                for i, (d, subdir_count, video_count) in enumerate(listing, start=1):
                     print(f"  {i}) {d.name}/ [{subdir_count} dirs | {video_count} videos]")
 
     
@@ -687,7 +1053,6 @@ def interactive_menu(start_dir: Path) -> None:
             files = iter_media_files(cwd)
             last_plan = build_rename_plan(files)
             write_plan_csv(last_plan, last_report_path)
-            write_plan_csv(last_plan, last_report_path)
             print(f"Scan complete. Planned renames: {len(last_plan)}")
             print(f"CSV written to: {last_report_path}")
             input("\n(press Enter to return)")
@@ -1,20 +1,31 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 import re, csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+import os
 import shutil
+import sys
 import unicodedata
 
 
 DEBUG_PARSE = True   # set False when done
 
+# threads for apply(); moves are I/O bound
+MOVE_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+# apply() rewrites its progress line in place every this many moves
+PROGRESS_EVERY = 1000
+
 # --- common release / scene junk tokens ---
 
 
 # --- token-level junk matcher (single tokens after normalize_for_tokens/tokenize) ---
-JUNK_WORDS = {
+# lowercase only: it's always probed with an already-lowered token
+JUNK_WORDS = frozenset({
     # services / sources
     "nf", "netflix", "amzn", "amazon", "prime", "hulu", "dsnp", "disney", "itunes",
 
@@ -38,13 +49,18 @@ JUNK_WORDS = {
     "cam", "hdcam", "ts", "hdts", "tc", "hdtc", "scr", "screener", "dvdscr", "r5", "line",
 
     # common trackers/sites (optional; harmless to drop)
-    "rarbg", "eztv", "yify", "tgx","H 264", "max", "hbo","hbomax","X264-DIMENSION","DDP5","XviD-DEMAND","WEB-DLRip","x264-BoB"
-}
+    "rarbg", "eztv", "yify", "tgx", "max", "hbo", "hbomax", "ddp5",
+})
+
+# junk that spans a separator ("XviD-DEMAND" tokenizes to "XviD" + "DEMAND"), so a
+# single-token lookup in JUNK_WORDS can never hit it; cut out of the name before tokenizing
+JUNK_PHRASES = ("H 264", "X264-DIMENSION", "XviD-DEMAND", "WEB-DLRip", "x264-BoB")
+RE_JUNK_PHRASE = re.compile(r"(?i)\b(?:" + "|".join(map(re.escape, JUNK_PHRASES)) + r")\b")
 
-KEEP_SHORT_WORDS = {
+KEEP_SHORT_WORDS = frozenset({
     "a","an","and","as","at","by","for","from","in","of","on","or","the","to","with",
     "new","old","bad","big","war","man","mr","ms","dr","vs","pt","part"
-}
+})
 
 
 
@@ -54,8 +70,8 @@ RE_AUDIO_TOKEN = re.compile(r"(?i)^(?:ddp?|eac3|ac3|aac|dts|truehd)(?:\d(?:\.\d)
 def suggest_show_name_from_folder(folder: Path) -> str:
     # basic suggestion: folder name with separators normalized
     s = strip_diacritics(folder.name)
-    s = re.sub(r"[._\-]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip(" .-_")
+    s = RE_SEP_RUN.sub(" ", s)
+    s = RE_WS.sub(" ", s).strip(" .-_")
     return s
 
 def ask_path() -> Path:
@@ -94,19 +110,23 @@ def ask_mode_and_show_name(target: Path) -> tuple[str, Optional[str]]:
     # default to parent
     return "parent", None
 
+VOWELS = frozenset("aeiou")
+ASCII_DIGITS = frozenset("0123456789")
+
 def looks_like_tag(tok: str) -> bool:
     t = tok.strip()
     if not t:
         return False
+    low = t.lower()
     # all-caps-ish short tokens are often tags/groups
-    if len(t) <= 6 and t.upper() == t and t.lower() != t:
-        return t.lower() not in KEEP_SHORT_WORDS
-    # tokens with digits are often tags
-    if any(c.isdigit() for c in t) and len(t) <= 10:
+    if len(t) <= 6 and low != t and t.upper() == t:
+        return low not in KEEP_SHORT_WORDS
+    # tokens with digits are often tags; set.isdisjoint walks the str in C
+    # (only valid for ascii, isdigit() also takes other scripts' digits)
+    if len(t) <= 10 and (not ASCII_DIGITS.isdisjoint(t) if t.isascii() else any(c.isdigit() for c in t)):
         return True
     # "no vowels" blobs like "nhtfs"
-    low = t.lower()
-    if len(low) <= 8 and low.isalnum() and not any(v in low for v in "aeiou"):
+    if len(low) <= 8 and low.isalnum() and VOWELS.isdisjoint(low):
         return True
     return False
 
@@ -169,34 +189,34 @@ def build_plan_season_folder(season_dir: Path) -> tuple[list[Move], list[tuple[P
         raise SystemExit("Show name is required for Season folder mode.")
 
     # try to extract season from folder name, else ask
-    m = re.search(r"(?i)(?:season\s*|s)(\d{1,2})", season_dir.name)
+    m = RE_SEASON_IN_NAME.search(season_dir.name)
     default_season = int(m.group(1)) if m else None
     season_num = prompt_season_number(default_season)
 
     plan: list[Move] = []
-    for src in sorted(season_dir.rglob("*")):
-        if not src.is_file() or src.suffix.lower() not in VIDEO_EXTS:
-            continue
-
+    existing: dict[Path, FolderNames] = {}
+    for src in sorted(iter_video_files(season_dir), key=PATH_ORDER):
         parsed = parse_season_episode(src.name)
         if not parsed:
             if DEBUG_PARSE:
                 debug_filename_parse(src.name)
             continue
 
-        _s, episode, raw_title = parsed
+        # the parsed title already went through tokenize/classify_tokens and comes
+        # back stripped, so it needs no second cleaning pass
+        _s, episode, title = parsed
         # Override season to the user-provided season_num
         s = season_num
 
-        title = clean_title_from_filename(src.name, raw_title)
-        title = re.sub(r"\s+", " ", title).strip(" .-_")
-
         ep_tag = f"S{z2(s)}E{z2(episode)}"
         new_base = f"{show_name} - {ep_tag}" + (f" - {title}" if title else "")
 
         new_name = ensure_single_extension(new_base, src)
         # rename in-place inside the season folder
-        dst = resolve_collision(src.with_name(new_name))
+        names = existing.get(src.parent)
+        if names is None:
+            names = existing[src.parent] = dir_names(src.parent)
+        dst = resolve_collision(src.with_name(new_name), names, src)
 
         if src != dst:
             plan.append(Move(src, dst))
@@ -270,46 +290,53 @@ def prompt_show_name_for_dir(show_dir: Path) -> str:
     suggested = suggest_show_name_from_folder(show_dir)
 
     raw = input(f"Set show name [{suggested}]: ")
-    name = re.sub(r"\s+", " ", raw).strip()
+    name = RE_WS.sub(" ", raw).strip()
 
     return name if name else suggested
 
-def get_show_dirs(root: Path) -> list[Path]:
-    """
-    If user points at a single show folder, return [root].
-    If user points at a library root, return immediate subfolders as show dirs.
-    """
-    if looks_like_single_show_dir(root):
-        return [root]
-    return sorted([p for p in root.iterdir() if p.is_dir()])
+# deletes - _ . in one translate (instead of three .replace copies)
+STRIP_JOINERS = str.maketrans("", "", "-_.")
+JOINERS = frozenset("-_.")
 
 # Token is junk if it is in JUNK_WORDS or looks like audio descriptor
-def is_junk_token(tok: str) -> bool:
-    low = tok.lower()
+def is_junk_token(tok: str, low: Optional[str] = None) -> bool:
+    # callers that already lowercased the token pass it as low
+    if low is None:
+        low = tok.lower()
     if low in JUNK_WORDS:
         return True
     if RE_AUDIO_TOKEN.match(low):
         return True
-    # handle "web-dl" that survived as "webdl" / "web dl" etc
-    if low.replace("-", "").replace("_", "").replace(".", "") in JUNK_WORDS:
+    # handle "web-dl" that survived as "webdl" / "web dl" etc; tokenize() already
+    # turned these chars into spaces, so usually there's nothing to strip (no copy)
+    if not JOINERS.isdisjoint(low) and low.translate(STRIP_JOINERS) in JUNK_WORDS:
         return True
     return False
 
-RE_BRACKETS = re.compile(r"""
-    (\[[^\]]*\]) |      # [stuff]
-    (\([^\)]*\)) |      # (stuff)
-    (\{[^\}]*\})        # {stuff}
-""", re.VERBOSE)
-
 # --- patterns we can normalize ---
 
+# compiled once here; the helpers below run them for every file
+RE_WS = re.compile(r"\s+")
+RE_SEP_RUN = re.compile(r"[._\-]+")
+RE_SPACED_DASH = re.compile(r"\s*-\s*")
+# [stuff] | (stuff) | {stuff}, dropped whole before tokenizing
+RE_BRACKETED = re.compile(r"\[[^\]]*\]|\([^\)]*\)|\{[^\}]*\}")
+RE_H26X = re.compile(r"(?i)\bh\s*[.\-_ ]\s*26([45])\b")
+RE_SEASON_IN_NAME = re.compile(r"(?i)(?:season\s*|s)(\d{1,2})")
 
-VIDEO_EXTS = {".mkv", ".mp4", ".avi", ".m4v", ".mov", ".wmv", ".m2ts"}
+# single-char separators -> space in one C pass (str.translate) instead of a regex each;
+# the runs of spaces this leaves get collapsed by " ".join(s.split()) afterwards
+TOKEN_SEPS_TO_SPACE = str.maketrans({c: " " for c in "[](){}._-/+,"})
+DOT_UNDERSCORE_TO_SPACE = str.maketrans({c: " " for c in "._"})
+
+VIDEO_EXTS = frozenset({".mkv", ".mp4", ".avi", ".m4v", ".mov", ".wmv", ".m2ts"})
 
 RE_SXXEYY = re.compile(r"(?i)^s(?P<s>\d{1,2})e(?P<e>\d{1,3})$")
 RE_XXxYY  = re.compile(r"(?i)^(?P<s>\d{1,2})x(?P<e>\d{1,3})$")
 
 RE_YEAR = re.compile(r"^(19\d{2}|20\d{2})$")
+# same \d the tag patterns use (any unicode decimal digit)
+RE_DIGIT = re.compile(r"\d")
 
 # Keep your JUNK_TOKENS list, but compile token-level junk matcher:
 
@@ -321,7 +348,11 @@ RE_YEAR = re.compile(r"^(19\d{2}|20\d{2})$")
 
 
 
+@lru_cache(maxsize=4096)
 def strip_diacritics(s: str) -> str:
+    # plain ascii has nothing to decompose or drop (the usual English library case)
+    if s.isascii():
+        return s
     nfkd = unicodedata.normalize("NFKD", s)
     return "".join(c for c in nfkd if not unicodedata.combining(c))
 
@@ -332,31 +363,32 @@ def normalize_for_tokens(stem: str) -> str:
     """
     s = strip_diacritics(stem)
 
-    # normalize common codec split cases like "H.264" / "H 265" -> "H264" / "H265"
-    s = re.sub(r"(?i)\bh\s*[.\-_ ]\s*26([45])\b", r"h26\1", s)
-
-    # drop bracket punctuation but keep contents as tokens
-    s = re.sub(r"[\[\]\(\)\{\}]", " ", s)
+    # multi-token junk goes first, while its separators are still there
+    s = RE_JUNK_PHRASE.sub(" ", s)
 
-    # turn common separators into spaces
-    s = re.sub(r"[._\-/+,]+", " ", s)
+    # normalize common codec split cases like "H.264" / "H 265" -> "H264" / "H265";
+    # the pattern needs a literal "26", and most names don't have one
+    if "26" in s:
+        s = RE_H26X.sub(r"h26\1", s)
 
-    # collapse whitespace
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # drop bracket punctuation (keeping contents as tokens) and turn common
+    # separators into spaces, then collapse whitespace
+    s = s.translate(TOKEN_SEPS_TO_SPACE)
+    return " ".join(s.split())
 
 
 def tokenize(stem: str) -> List[str]:
     norm = normalize_for_tokens(stem)
-    return [t for t in norm.split(" ") if t]
+    # normalize_for_tokens already left single spaces only
+    return norm.split()
 
 # group tags often look like short alnum blobs, mostly uppercase in source, but after normalization we see lowercase
 RE_GROUP_TAG = re.compile(r"(?i)^[a-z0-9]{2,12}$")
 # very common “word-like but actually junk” tokens we still want gone
-EXTRA_JUNK_LITERALS = {
+EXTRA_JUNK_LITERALS = frozenset({
     "nhtfs", "tgx", "tggx", "ntb", "yts", "ettv", "ion10",
     "rarbg", "eztv", "yify",
-}
+})
 
 
 # very common “word-like but actually junk” tokens we still want gone
@@ -370,42 +402,39 @@ def classify_tokens(tokens: List[str]) -> Tuple[Optional[int], Optional[int], Li
     title: List[str] = []
     removed: List[str] = []
 
+    # each regex below only runs when a cheap check on the token says it could
+    # match at all; most tokens are plain words that skip all three
     for tok in tokens:
         low = tok.lower()
 
-        # s01e02 or s1e8
-        m = RE_SXXEYY.match(low)
+        # s01e02 or s1e8 (starts with s; IGNORECASE also lets the long s "ſ" match)
+        m = RE_SXXEYY.match(low) if low[:1] in ("s", "ſ") else None
         if m:
             season = int(m.group("s"))
             episode = int(m.group("e"))
             removed.append(tok)
             continue
 
-        # 1x02
-        m = RE_XXxYY.match(low)
-        
-        if looks_like_tag(tok) and tok.lower() not in KEEP_SHORT_WORDS:
+        if looks_like_tag(tok) and low not in KEEP_SHORT_WORDS:
             removed.append(tok)
             continue
 
+        # 1x02
+        m = RE_XXxYY.match(low) if "x" in low else None
         if m:
             season = int(m.group("s"))
             episode = int(m.group("e"))
             removed.append(tok)
             continue
 
-        # junk tokens (services / codecs / quality / etc)
-        if is_junk_token(tok):
-            removed.append(tok)
-            continue
-
-        # extra hardcoded group literals (NHTFS, TGx, YTS, etc)
-        if low in EXTRA_JUNK_LITERALS:
+        # extra hardcoded group literals (NHTFS, TGx, YTS, etc) and junk tokens
+        # (services / codecs / quality / etc); the cheap set lookup goes first
+        if low in EXTRA_JUNK_LITERALS or is_junk_token(tok, low):
             removed.append(tok)
             continue
 
         # years (usually irrelevant for episodes)
-        if RE_YEAR.match(tok):
+        if len(tok) == 4 and RE_YEAR.match(tok):
             removed.append(tok)
             continue
 
@@ -421,14 +450,22 @@ def classify_tokens(tokens: List[str]) -> Tuple[Optional[int], Optional[int], Li
 
 
 
+@lru_cache(maxsize=8192)
 def parse_episode_from_filename(filename: str) -> Optional[Tuple[int, int, str]]:
     """
     Return (season, episode, cleaned_title) or None if no valid tag.
+    Cached by filename, so rebuilding the plan ('p') doesn't re-parse everything.
     """
     stem = Path(filename).stem
 
     # Remove bracketed chunks completely before tokenizing (TGx, group tags, etc.)
-    stem = re.sub(r"\[[^\]]*\]|\([^\)]*\)|\{[^\}]*\}", " ", stem)
+    stem = RE_BRACKETED.sub(" ", stem)
+
+    # both tag shapes (s01e02 / 1x02) need a digit, and none of the normalizing
+    # after strip_diacritics (cached, so tokenize gets it for free) can make one.
+    # No digit -> no tag, so skip tokenizing extras/samples/movies entirely
+    if not RE_DIGIT.search(strip_diacritics(stem)):
+        return None
 
     tokens = tokenize(stem)
     s, e, title_tokens, _removed = classify_tokens(tokens)
@@ -436,81 +473,78 @@ def parse_episode_from_filename(filename: str) -> Optional[Tuple[int, int, str]]
     if s is None or e is None:
         return None
 
-    title = " ".join(title_tokens).strip()
-    title = re.sub(r"\s+", " ", title)
+    # tokens carry no whitespace, so the join is already single-spaced;
+    # this is the one strip callers rely on
+    title = " ".join(title_tokens).strip(" .-_")
 
     return s, e, title
 
 
 # e.g. "The Amazing World of Gumball - 105a - The Pressure ..."
 RE_DASH_NUM = re.compile(r"(?i)\s-\s(?P<num>\d{3,4})(?P<part>[ab])?\s-\s")
-RE_SEASON_DIR = re.compile(r"(?i)\bseason\s*(\d{1,2})\b|^s(\d{1,2})$")
-
-def clean_title_from_filename(filename: str, fallback_title: str) -> str:
-    """
-    Uses the SAME tokenization + junk filtering rules to clean a title string.
-    This avoids needing a separate clean_release_junk() function.
-    """
-    # Build a fake "stem" so we can reuse tokenize/classify_tokens.
-    # Example: fallback_title might contain WEB / 1080p / H264 etc.
-    stem = fallback_title
-
-    # remove bracketed junk
-    stem = re.sub(r"\[[^\]]*\]|\([^\)]*\)|\{[^\}]*\}", " ", stem)
-
-    toks = tokenize(stem)
-    _s, _e, title_tokens, _removed = classify_tokens(toks)
-
-    title = " ".join(title_tokens).strip()
-    title = re.sub(r"\s+", " ", title)
-    return title.strip(" .-_")
 
 def pre_normalize_for_parsing(s: str) -> str:
     # strip diacritics first so regex sees stable ASCII-ish text
     s = strip_diacritics(s)
     # unify separators so "Shōgun_S01E02_Title" becomes "Shogun S01E02 Title"
-    s = re.sub(r"[._]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = s.translate(DOT_UNDERSCORE_TO_SPACE)
+    return " ".join(s.split())
 
 
 def normalize_punct(s: str) -> str:
     # convert separators to spaces, collapse whitespace
     s = strip_diacritics(s)
 
-    s = re.sub(r"[._]+", " ", s)
-    s = re.sub(r"\s*-\s*", " - ", s)
-    s = re.sub(r"\s+", " ", s).strip(" -._")
-    return s
+    s = s.translate(DOT_UNDERSCORE_TO_SPACE)
+    s = RE_SPACED_DASH.sub(" - ", s)
+    return " ".join(s.split()).strip(" -._")
 
 RE_TAG_SXXEYY = re.compile(r"(?i)S(?P<s>\d{1,2})\s*E(?P<e>\d{1,3})")
 RE_TAG_XXxYY  = re.compile(r"(?i)(?P<s>\d{1,2})x(?P<e>\d{1,3})")
 
 
-def looks_like_single_show_dir(p: Path) -> bool:
-    if RE_SEASON_DIR.search(p.name):
-        return False
-    # If this folder contains season-ish subfolders OR video files anywhere, treat it as a single show
-    try:
-        for child in p.iterdir():
-            if child.is_dir() and RE_SEASON_DIR.search(child.name):
-                return True
-        # fallback: if there are videos inside, it's probably a show dir
-        return any(f.is_file() and f.suffix.lower() in VIDEO_EXTS for f in p.rglob("*"))
-    except PermissionError:
-        return False
+# sort key for the video lists: same order as sorting the Paths themselves (on
+# posix), but the parts tuple is built once per path instead of per comparison
+PATH_ORDER = attrgetter("parts")
+
+def iter_video_files(root: Path) -> Iterator[Path]:
+    """
+    Every video file under root at any depth, in no particular order. Same set as
+    rglob("*") + is_file() + suffix check, but one scandir per folder: the file/dir
+    type comes from the directory read and the extension is checked on the bare
+    name, so only actual videos get a stat or become a Path.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    name = e.name
+                    # Path.suffix: text from the last dot, no suffix for ".mkv"-style names
+                    dot = name.rfind(".")
+                    try:
+                        if dot > 0 and name[dot:].lower() in VIDEO_EXTS and e.is_file():
+                            yield Path(e.path)
+                        # like rglob, don't descend into symlinked dirs
+                        elif e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
-def safe_move(src: Path, dst: Path) -> bool:
+def safe_move(src: Path, dst: Path) -> Optional[str]:
+    # None on success, else the error text; the caller prints it (apply runs this
+    # on worker threads, where printing would cut into the progress line)
     try:
         src.rename(dst)
-        return True
+        return None
     except Exception as e1:
         try:
             shutil.move(str(src), str(dst))
-            return True
+            return None
         except Exception as e2:
-            print(f"[FAIL move] {src} -> {dst} (rename: {e1}; shutil: {e2})")
-            return False
+            return f"rename: {e1}; shutil: {e2}"
 
         
 def ensure_single_extension(base_no_ext: str, src: Path) -> str:
@@ -521,12 +555,13 @@ def ensure_single_extension(base_no_ext: str, src: Path) -> str:
     base = base_no_ext.strip()
 
     # If base accidentally ends with a known extension, strip it
+    # every ext is a single ".xxx", so only the text after the last dot can be one:
+    # one slice + set lookup instead of an endswith per ext
     lower = base.lower()
-    for ext in VIDEO_EXTS:
-        if lower.endswith(ext):
-            base = base[:-len(ext)]
-            base = base.rstrip(" .-_")
-            break
+    ext = lower[lower.rfind("."):]
+    if ext in VIDEO_EXTS:
+        base = base[:-len(ext)]
+        base = base.rstrip(" .-_")
 
     return f"{base}{src.suffix.lower()}"
 @dataclass
@@ -537,16 +572,80 @@ class Move:
 def z2(n: int) -> str:
     return f"{n:02d}"
 
-def resolve_collision(dst: Path) -> Path:
-    if not dst.exists():
-        return dst
-    stem = dst.with_suffix("").name
-    ext = dst.suffix
-    for i in range(1, 1000):
-        cand = dst.with_name(f"{stem} - dup{i}{ext}")
-        if not cand.exists():
-            return cand
-    raise RuntimeError(f"Too many collisions for {dst}")
+@dataclass
+class FolderNames:
+    """What resolve_collision needs to know about one destination folder."""
+    ignores_case: bool  # exists() ignores case here (default macOS volumes)
+    on_disk: set[str]   # names already there; casefolded if ignores_case, else exact
+    claimed: set[str]   # casefolded names handed out earlier in this plan
+
+
+def dir_names(d: Path) -> FolderNames:
+    """
+    One listing of d (empty if it doesn't exist yet), for resolve_collision.
+    Whether the volume ignores case is probed with one lstat: a listed name, asked
+    for in the other case. With no name to try, case can't matter for d's names.
+    """
+    try:
+        with os.scandir(d) as it:
+            names = {e.name for e in it}
+    except OSError:
+        names = set()
+    for name in names:
+        other = name.swapcase()
+        if other != name and other.swapcase() == name and other not in names:
+            try:
+                os.lstat(os.path.join(d, other))
+            except OSError:
+                break
+            return FolderNames(True, {n.casefold() for n in names}, set())
+    return FolderNames(False, names, set())
+
+def resolve_collision(dst: Path, existing: Optional[FolderNames] = None, src: Optional[Path] = None) -> Path:
+    """
+    dst, or the first free "<stem> - dupN<ext>" next to it. With existing (from
+    dir_names(dst.parent)) the probing is done against that listing instead of a
+    stat per candidate (same answer exists() gives, case rules included), and the
+    name handed out is claimed so a later file in the same plan can't be given it.
+    src, when it sits in the same folder, doesn't count as in its own way: renaming
+    a file to its current name (or a case-only change) isn't a collision.
+    """
+    if existing is None:
+        if not dst.exists():
+            return dst
+        stem = dst.with_suffix("").name
+        ext = dst.suffix
+        for i in range(1, 1000):
+            cand = dst.with_name(f"{stem} - dup{i}{ext}")
+            if not cand.exists():
+                return cand
+        raise RuntimeError(f"Too many collisions for {dst}")
+
+    ignores_case = existing.ignores_case
+    own = None
+    if src is not None and src.parent == dst.parent:
+        own = src.name.casefold() if ignores_case else src.name
+
+    def taken(name: str) -> bool:
+        folded = name.casefold()
+        if folded in existing.claimed:
+            return True
+        key = folded if ignores_case else name
+        return key != own and key in existing.on_disk
+
+    name = dst.name
+    if taken(name):
+        stem = dst.with_suffix("").name
+        ext = dst.suffix
+        for i in range(1, 1000):
+            name = f"{stem} - dup{i}{ext}"
+            if not taken(name):
+                break
+        else:
+            raise RuntimeError(f"Too many collisions for {dst}")
+        dst = dst.with_name(name)
+    existing.claimed.add(name.casefold())
+    return dst
 
 def season_folder(show_dir: Path, season: int) -> Path:
     return show_dir / f"Season {z2(season)}"
@@ -555,14 +654,15 @@ def season_folder(show_dir: Path, season: int) -> Path:
 
 def parse_season_episode(filename: str) -> Optional[Tuple[int, int, str]]:
     """
-    Returns (season, episode, raw_title) or None if no valid S/E tag.
+    Returns (season, episode, title) or None if no valid S/E tag.
+    The title is already junk-filtered.
     """
     return parse_episode_from_filename(filename)
 
 
 def debug_filename_parse(filename: str) -> None:
     stem = Path(filename).stem
-    stem2 = re.sub(r"\[[^\]]*\]|\([^\)]*\)|\{[^\}]*\}", " ", stem)
+    stem2 = RE_BRACKETED.sub(" ", stem)
     toks = tokenize(stem2)
     s, e, title, removed = classify_tokens(toks)
     print("FILE:", filename)
@@ -574,22 +674,19 @@ def debug_filename_parse(filename: str) -> None:
 
 def build_plan_for_show_dir(show_dir: Path, show_name: str) -> list[Move]:
     plan: list[Move] = []
-    show_name_clean = re.sub(r"\s+", " ", show_name).strip()
-
-    for src in sorted(show_dir.rglob("*")):
-        if not src.is_file() or src.suffix.lower() not in VIDEO_EXTS:
-            continue
+    show_name_clean = RE_WS.sub(" ", show_name).strip()
+    # one listing per Season folder instead of an exists() per candidate name
+    existing: dict[Path, FolderNames] = {}
 
+    for src in sorted(iter_video_files(show_dir), key=PATH_ORDER):
         parsed = parse_season_episode(src.name)
         if not parsed:
             if DEBUG_PARSE:
                 debug_filename_parse(src.name)
             continue
 
-        season, episode, raw_title = parsed
-
-        title = clean_title_from_filename(src.name, raw_title)
-        title = re.sub(r"\s+", " ", title).strip(" .-_")
+        # already cleaned and stripped by the parse (see build_plan_season_folder)
+        season, episode, title = parsed
 
         # If title is just the show name, drop it
         if title.lower() == show_name_clean.lower():
@@ -605,7 +702,10 @@ def build_plan_for_show_dir(show_dir: Path, show_name: str) -> list[Move]:
 
         dst_dir = season_folder(show_dir, season)
         new_name = ensure_single_extension(new_base, src)
-        dst = resolve_collision(dst_dir / new_name)
+        names = existing.get(dst_dir)
+        if names is None:
+            names = existing[dst_dir] = dir_names(dst_dir)
+        dst = resolve_collision(dst_dir / new_name, names, src)
 
         if src != dst:
             plan.append(Move(src, dst))
@@ -616,26 +716,56 @@ def build_plan_for_show_dir(show_dir: Path, show_name: str) -> list[Move]:
 
 def write_csv(plan: list[Move], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(["src", "dst"])
-        for m in plan:
-            w.writerow([str(m.src), str(m.dst)])
+        # one writerows call over (src, dst) tuples; csv str()s the Paths itself
+        w.writerows(map(attrgetter("src", "dst"), plan))
+
+def move_chain(moves: list[Move]) -> list[tuple[Move, Optional[str]]]:
+    # moves that share a dst, run in plan order so the same file ends up there as
+    # it would with a one-by-one apply
+    return [(m, safe_move(m.src, m.dst)) for m in moves]
 
 def apply(plan: list[Move]) -> None:
     total = len(plan)
-
-    for i, m in enumerate(plan, start=1):
-        if i == 1 or i % 100 == 0 or i == total:
-            pct = (i / total) * 100 if total else 100.0
-            print(f"[{i}/{total}] {pct:6.2f}%")
-
-        m.dst.parent.mkdir(parents=True, exist_ok=True)
-
-        ok = safe_move(m.src, m.dst)
-        if not ok:
-            print(f"[FAIL move] {m.src} -> {m.dst}")
-            continue
+    # most moves land in a handful of Season folders; mkdir each of them once,
+    # up front, so the moves themselves can run on a pool
+    made_dirs: set[Path] = set()
+    for m in plan:
+        parent = m.dst.parent
+        if parent not in made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(parent)
+
+    # rename/move is a syscall (or a copy across volumes) that drops the GIL, so
+    # independent moves overlap. Moves onto the same dst (case-insensitively, for
+    # macOS volumes) stay together in one task, in order
+    chains: dict[str, list[Move]] = {}
+    for m in plan:
+        chains.setdefault(str(m.dst).casefold(), []).append(m)
+
+    done = 0
+    out = sys.stdout
+    on_progress_line = False
+    with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as ex:
+        futures = [ex.submit(move_chain, moves) for moves in chains.values()]
+        # progress/failures are written from this thread only, so no lock around
+        # the counter; progress is one line overwritten with \r, flushed per update
+        for fut in as_completed(futures):
+            for m, err in fut.result():
+                done += 1
+                if err is not None:
+                    if on_progress_line:
+                        out.write("\n")
+                        on_progress_line = False
+                    out.write(f"[FAIL move] {m.src} -> {m.dst} ({err})\n")
+                if done == 1 or done % PROGRESS_EVERY == 0 or done == total:
+                    out.write(f"\r[{done}/{total}] {done / total * 100:6.2f}%")
+                    out.flush()
+                    on_progress_line = True
+    if on_progress_line:
+        out.write("\n")
 
 if __name__ == "__main__":
     target = ask_path()
@@ -15,7 +15,11 @@ import shutil
 import pydoc
 import csv
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 import os
 from typing import Iterator, Iterable, Set, List, Tuple
@@ -25,9 +29,13 @@ import stat
 
 
 IGNORE_DIRS = {"BONUS_FEATURES", ".git", "__pycache__", "reports"}
-VALID_VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".m4v", ".mov", ".wmv", ".m2ts"}
-SIDECAR_EXTENSIONS = {".srt", ".ass", ".ssa", ".vtt", ".sub", ".idx", ".nfo"}
+VALID_VIDEO_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".m4v", ".mov", ".wmv", ".m2ts"})
+SIDECAR_EXTENSIONS = frozenset({".srt", ".ass", ".ssa", ".vtt", ".sub", ".idx", ".nfo"})
+# same, without the dot, to test split(".") pieces directly
+SIDECAR_EXTS_NODOT = frozenset(e[1:] for e in SIDECAR_EXTENSIONS)
 NEEDS_ATTENTION_DIR = "NEEDS_ATTENTION"
+# threads for reading SOURCE folders; readdir on a NAS is mostly waiting
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 MACOS_SYSTEM_DIRS = {
     ".spotlight-v100",
     ".fseventsd",
@@ -49,23 +57,61 @@ TV_EP_RE = re.compile(r"\bS\d{1,2}E\d{1,2}\b", re.IGNORECASE)
 
 # -------------------- Core planner types --------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MoveItem:
     original: Path
     proposed: Path
-    action: str  # mkdir / move_video / move_sidecar / move_folder
+    # mkdir / move_video / move_sidecar / move_folder / move_attention. Always one of
+    # these literals, so every item shares the same interned str objects.
+    action: str
 
 
 # -------------------- Helpers --------------------
-def walk_files(root: Path, *, ignore_dir_names: Iterable[str] = ()) -> Iterator[Path]:
-    root = Path(root)
+def scan_one_dir(path: str, ignore: Set[str]) -> Tuple[List[os.DirEntry], List[str]]:
+    """One directory's files and (non-ignored, non-symlinked) subdirectory paths."""
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if e.name.lower() not in ignore:
+                            subdirs.append(e.path)
+                    elif e.is_file():
+                        files.append(e)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+def walk_ignore_set(ignore_dir_names: Iterable[str]) -> Set[str]:
     ignore: Set[str] = {n.lower() for n in ignore_dir_names}
     ignore |= {d.lower() for d in MACOS_SYSTEM_DIRS}   # <-- add here
+    return ignore
 
-    for dirpath, dirnames, filenames in os.walk(root, topdown=True):
-        dirnames[:] = [d for d in dirnames if d.lower() not in ignore]
-        for fn in filenames:
-            yield Path(dirpath) / fn
+def walk_entries_parallel(root: Path, *, ignore_dir_names: Iterable[str] = ()) -> Iterator[os.DirEntry]:
+    """
+    Walk ALL nested dirs under root and yield the DirEntry of every file.
+    Prunes ignore_dir_names + the macOS system dirs (case-insensitive), doesn't
+    follow symlinked dirs. Uses os.scandir directly, so the file/dir check comes
+    from the directory read (no stat per entry) and nothing becomes a Path here.
+    Folders are read on a thread pool: scandir drops the GIL, so on a NAS/SMB
+    share many folder reads are in flight at once instead of one round trip after
+    another. Order is arbitrary; callers sort.
+    """
+    ignore = walk_ignore_set(ignore_dir_names)
+
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        pending = {ex.submit(scan_one_dir, str(root), ignore)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                files, subdirs = fut.result()
+                for d in subdirs:
+                    pending.add(ex.submit(scan_one_dir, d, ignore))
+                yield from files
 
 def clear_screen() -> None:
     os.system("cls" if os.name == "nt" else "clear")
@@ -78,12 +124,13 @@ C_YELLOW = "\033[33m"
 def colorize(text: str, color: str) -> str:
     return f"{color}{text}{C_RESET}"
 
-def is_trash_file(p: Path) -> bool:
+def is_trash_file(p: Path | os.DirEntry) -> bool:
     n = p.name.lower()
     return n in TRASH_FILES or any(n.startswith(pref) for pref in TRASH_PREFIXES)
 
-def is_bonus_dir(p: Path) -> bool:
-    return p.is_dir() and p.name.lower() == BONUS_DIR_L
+def is_bonus_dir(p: Path | os.DirEntry) -> bool:
+    # name first: it's free, is_dir() may stat (always for a Path)
+    return p.name.lower() == BONUS_DIR_L and p.is_dir()
 
 def status_line(label: str, path: Path | None, ok: bool, warn: bool = False) -> str:
     if not path:
@@ -95,7 +142,12 @@ def status_line(label: str, path: Path | None, ok: bool, warn: bool = False) ->
         return f"{label}: {colorize(s, C_YELLOW)}"
     return f"{label}: {colorize(s, C_RED)}"
 
+@lru_cache(maxsize=8192)
 def is_tv_episode_name(name: str) -> bool:
+    # the tag needs an S (IGNORECASE also lets the long s "ſ" match it);
+    # names without one never reach the regex
+    if "s" not in name and "S" not in name and "ſ" not in name:
+        return False
     return bool(TV_EP_RE.search(name))
 
 
@@ -104,7 +156,17 @@ def is_in_bonus_features(path: Path) -> bool:
 
 
 
+# for ASCII text isalpha()/isdigit() are exactly these two ranges
+ASCII_ALNUM_RE = re.compile(r"[A-Za-z0-9]")
+
 def bucket_letter(title_base: str) -> str:
+    if title_base.isascii():
+        # one C-level scan instead of two unicode-db calls per leading char
+        m = ASCII_ALNUM_RE.search(title_base)
+        if m is None:
+            return "_"
+        ch = m.group()
+        return "#" if ch <= "9" else ch.upper()
     for ch in title_base:
         if ch.isalpha():
             return ch.upper()
@@ -113,28 +175,83 @@ def bucket_letter(title_base: str) -> str:
     return "_"
 
 
-def resolve_collision_path(target: Path) -> Path:
-    """If file target exists, append ' - dupN' before extension."""
-    if not target.exists():
-        return target
-    base = target.with_suffix("")
-    ext = target.suffix
-    for i in range(1, 1000):
-        cand = Path(f"{base} - dup{i}{ext}")
-        if not cand.exists():
-            return cand
-    raise RuntimeError(f"Too many file collisions for {target}")
-
-
-def resolve_collision_dir(target: Path) -> Path:
-    """If folder target exists, append ' - dupN'."""
-    if not target.exists():
-        return target
-    for i in range(1, 1000):
-        cand = Path(str(target) + f" - dup{i}")
-        if not cand.exists():
-            return cand
-    raise RuntimeError(f"Too many folder collisions for {target}")
+def dir_names(d: Path) -> set[str]:
+    """
+    Casefolded names in d (empty if it doesn't exist yet), for the collision
+    resolvers. Casefolded so a name differing only by case counts as taken, like
+    exists() on a default macOS volume.
+    """
+    try:
+        with os.scandir(d) as it:
+            return {e.name.casefold() for e in it}
+    except OSError:
+        return set()
+
+
+def cached_dir_names(cache: dict[Path, set[str]], d: Path) -> set[str]:
+    """dir_names(d), listed once per plan (cache lives in the plan builder)."""
+    names = cache.get(d)
+    if names is None:
+        names = cache[d] = dir_names(d)
+    return names
+
+
+def resolve_collision_path(target: Path, existing: set[str] | None = None) -> Path:
+    """
+    If file target exists, append ' - dupN' before extension.
+    With existing (dir_names(target.parent)) candidates are checked against that set
+    instead of a stat each, and the chosen name is added to it, so a later item in
+    the same plan can't be given the same name.
+    """
+    if existing is None:
+        if not target.exists():
+            return target
+        base = target.with_suffix("")
+        ext = target.suffix
+        for i in range(1, 1000):
+            cand = Path(f"{base} - dup{i}{ext}")
+            if not cand.exists():
+                return cand
+        raise RuntimeError(f"Too many file collisions for {target}")
+
+    name = target.name
+    if name.casefold() in existing:
+        stem = target.stem
+        ext = target.suffix
+        for i in range(1, 1000):
+            name = f"{stem} - dup{i}{ext}"
+            if name.casefold() not in existing:
+                break
+        else:
+            raise RuntimeError(f"Too many file collisions for {target}")
+        target = target.with_name(name)
+    existing.add(name.casefold())
+    return target
+
+
+def resolve_collision_dir(target: Path, existing: set[str] | None = None) -> Path:
+    """If folder target exists, append ' - dupN'. existing works as in resolve_collision_path."""
+    if existing is None:
+        if not target.exists():
+            return target
+        for i in range(1, 1000):
+            cand = Path(str(target) + f" - dup{i}")
+            if not cand.exists():
+                return cand
+        raise RuntimeError(f"Too many folder collisions for {target}")
+
+    name = target.name
+    if name.casefold() in existing:
+        base = name
+        for i in range(1, 1000):
+            name = f"{base} - dup{i}"
+            if name.casefold() not in existing:
+                break
+        else:
+            raise RuntimeError(f"Too many folder collisions for {target}")
+        target = target.with_name(name)
+    existing.add(name.casefold())
+    return target
 
 def iter_all_files(root: Path, recursive: bool = True) -> List[Path]:
     it = root.rglob("*") if recursive else root.iterdir()
@@ -149,9 +266,10 @@ def iter_all_files(root: Path, recursive: bool = True) -> List[Path]:
 
 def iter_video_files(root: Path) -> list[Path]:
     out: list[Path] = []
-    for p in walk_files(root, ignore_dir_names=IGNORE_DIRS):
-        if p.is_file() and p.suffix.lower() in VALID_VIDEO_EXTENSIONS:
-            out.append(p)
+    # sorted below, so the arbitrary order of the parallel walk doesn't matter
+    for e in walk_entries_parallel(root, ignore_dir_names=IGNORE_DIRS):
+        if has_video_ext(e.name):
+            out.append(Path(e.path))
     return sorted(out)
 
 def build_video_stem_index(source_root: Path) -> dict[Path, set[str]]:
@@ -197,6 +315,9 @@ def build_needs_attention_plan(
     all_files.sort()
 
     base_na = dest_root / NEEDS_ATTENTION_DIR
+    # target dir -> names already there or handed out by this plan
+    taken: dict[Path, set[str]] = {}
+    seen: set[str] = set()
 
     for p in all_files:
         if p in handled_sources:
@@ -212,24 +333,16 @@ def build_needs_attention_plan(
             ext_bucket = ext_bucket_name(p)
 
         target_dir = base_na / ext_bucket / rel_parent
-        plan.append(MoveItem(original=target_dir, proposed=target_dir, action="mkdir"))
+        # one mkdir per target dir, the first time it comes up
+        k = str(target_dir)
+        if k not in seen:
+            seen.add(k)
+            plan.append(MoveItem(original=target_dir, proposed=target_dir, action="mkdir"))
 
-        proposed = resolve_collision_path(target_dir / p.name)
+        proposed = resolve_collision_path(target_dir / p.name, cached_dir_names(taken, target_dir))
         plan.append(MoveItem(original=p, proposed=proposed, action="move_attention"))
 
-
-    # de-dupe mkdirs
-    seen = set()
-    out: List[MoveItem] = []
-    for item in plan:
-        if item.action == "mkdir":
-            k = str(item.proposed)
-            if k in seen:
-                continue
-            seen.add(k)
-        out.append(item)
-
-    return out
+    return plan
 def remove_empty_dirs(root: Path, *, ignore_names: set[str] | None = None) -> int:
     """
     Remove empty directories bottom-up.
@@ -263,28 +376,33 @@ def is_single_movie_folder(folder: Path) -> bool:
     if not folder.is_dir():
         return False
 
+    # one scandir serves both passes; entry types come with the listing (no stat per
+    # entry unless it's a symlink, which is followed like Path.is_file/is_dir)
+    with os.scandir(folder) as it:
+        entries = list(it)
+
     video_files = []
-    for p in folder.iterdir():
-        if p.is_file() and p.suffix.lower() in VALID_VIDEO_EXTENSIONS and not is_tv_episode_name(p.name):
-            video_files.append(p)
+    for e in entries:
+        if has_video_ext(e.name) and e.is_file() and not is_tv_episode_name(e.name):
+            video_files.append(e.name)
 
     if len(video_files) != 1:
         return False
 
     # validate everything else in folder is allowed
-    for p in folder.iterdir():
-        if p == video_files[0]:
+    for e in entries:
+        name = e.name
+        if name == video_files[0]:
             continue
 
-        if is_bonus_dir(p):
+        if is_bonus_dir(e):
             continue
 
-        if p.is_file():
-            if is_trash_file(p):
+        if e.is_file():
+            if is_trash_file(e):
                 continue
 
-            suffixes = {s.lower() for s in p.suffixes}
-            if suffixes & SIDECAR_EXTENSIONS:
+            if has_sidecar_suffix(name):
                 continue
 
         # anything else breaks the "single movie folder" assumption
@@ -294,21 +412,50 @@ def is_single_movie_folder(folder: Path) -> bool:
 
 
 
-def find_sidecars(video_file: Path) -> List[Path]:
+def has_video_ext(name: str) -> bool:
+    """name's suffix (Path.suffix rules: from the last dot, none for ".mkv") is a video ext."""
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in VALID_VIDEO_EXTENSIONS
+
+
+def has_sidecar_suffix(name: str) -> bool:
+    """Any of name's suffixes (Path.suffixes rules) is a sidecar ext, e.g. Movie.srt.bak."""
+    if name.endswith(".") or "." not in name:
+        return False
+    return not SIDECAR_EXTS_NODOT.isdisjoint(name.lower().lstrip(".").split(".")[1:])
+
+
+def list_file_names(folder: Path) -> List[str]:
+    """Names of the files directly in folder, in directory order (one scandir)."""
+    with os.scandir(folder) as it:
+        return [e.name for e in it if e.is_file()]
+
+
+def find_sidecars(video_file: Path, file_names: List[str] | None = None) -> List[Path]:
+    """
+    Sidecars next to video_file. file_names is list_file_names(parent) if the
+    caller already has it (build_sort_plan keeps one per folder), else it's read here.
+    """
     parent = video_file.parent
     stem = video_file.stem
     out: List[Path] = []
 
-    for p in parent.iterdir():
-        if not p.is_file() or is_in_bonus_features(p):
-            continue
+    # the parent is the same for every sibling, so one check covers them all
+    if is_in_bonus_features(parent):
+        return out
+
+    if file_names is None:
+        file_names = list_file_names(parent)
 
-        # exact stem or stem.<something>
-        if p.stem != stem and not p.name.startswith(stem + "."):
+    # plain strings while filtering; only matches become Paths
+    prefix = stem + "."
+    for name in file_names:
+        # exact stem or stem.<something> (a sibling whose stem == stem is one of these)
+        if name != stem and not name.startswith(prefix):
             continue
 
-        if any(s.lower() in SIDECAR_EXTENSIONS for s in p.suffixes):
-            out.append(p)
+        if has_sidecar_suffix(name):
+            out.append(parent / name)
 
     return out
 
@@ -329,21 +476,39 @@ def build_sort_plan(source_root: Path, dest_root: Path) -> List[MoveItem]:
     videos.sort()
 
     seen_movie_folders = set()
+    # DEST/Movies/<letter>, built once per letter instead of per video
+    letter_dirs: dict[str, Path] = {}
+    # folder -> its file names, so K loose videos in one folder share one listing
+    folder_files: dict[Path, List[str]] = {}
+    # DEST dir -> names already there or handed out by this plan
+    taken: dict[Path, set[str]] = {}
+    seen_mkdirs: set[str] = set()
+    # videos in the same folder share the answer; scan each folder once per plan
+    single_folder: dict[Path, bool] = {}
 
     for vid in videos:
         parent = vid.parent
 
-        # Single-movie folder: move the folder as the movie directory
-        if is_single_movie_folder(parent):
+        is_single = single_folder.get(parent)
+        if is_single is None:
+            is_single = single_folder[parent] = is_single_movie_folder(parent)
+
+        if is_single:
             if str(parent) in seen_movie_folders:
                 continue
             seen_movie_folders.add(str(parent))
 
-            base = create_new_base(vid)
-            letter = bucket_letter(base)
+        # both branches file the movie under DEST/Movies/<letter>/<base>
+        base = create_new_base(vid)
+        letter = bucket_letter(base)
+        letter_dir = letter_dirs.get(letter)
+        if letter_dir is None:
+            letter_dir = letter_dirs[letter] = dest_root / "Movies" / letter
 
-            dest_movie_dir = dest_root / "Movies" / letter / base
-            dest_movie_dir = resolve_collision_dir(dest_movie_dir)
+        # Single-movie folder: move the folder as the movie directory
+        if is_single:
+            dest_movie_dir = letter_dir / base
+            dest_movie_dir = resolve_collision_dir(dest_movie_dir, cached_dir_names(taken, letter_dir))
 
             plan.append(MoveItem(
                 original=parent,
@@ -353,44 +518,51 @@ def build_sort_plan(source_root: Path, dest_root: Path) -> List[MoveItem]:
             continue
 
         # Loose movie: mkdir + move file + move sidecars
-        base = create_new_base(vid)
-        letter = bucket_letter(base)
-
-        movie_dir = dest_root / "Movies" / letter / base
-        plan.append(MoveItem(original=movie_dir, proposed=movie_dir, action="mkdir"))
-
-        proposed_vid = resolve_collision_path(movie_dir / (base + vid.suffix.lower()))
+        movie_dir = letter_dir / base
+        # one mkdir per movie dir, the first time it comes up
+        key = str(movie_dir)
+        if key not in seen_mkdirs:
+            seen_mkdirs.add(key)
+            plan.append(MoveItem(original=movie_dir, proposed=movie_dir, action="mkdir"))
+
+        movie_names = taken.get(movie_dir)
+        if movie_names is None:
+            # the letter dir's listing already says whether the movie dir exists;
+            # on a fresh DEST it doesn't, so there's nothing in it to list
+            if base.casefold() in cached_dir_names(taken, letter_dir):
+                movie_names = cached_dir_names(taken, movie_dir)
+            else:
+                movie_names = taken[movie_dir] = set()
+        proposed_vid = resolve_collision_path(movie_dir / (base + vid.suffix.lower()), movie_names)
         plan.append(MoveItem(original=vid, proposed=proposed_vid, action="move_video"))
 
-        for sc in find_sidecars(vid):
-            tail = sc.name[len(vid.stem):]
-            proposed_sc = resolve_collision_path(movie_dir / (base + tail))
-            plan.append(MoveItem(original=sc, proposed=proposed_sc, action="move_sidecar"))
+        file_names = folder_files.get(parent)
+        if file_names is None:
+            file_names = folder_files[parent] = list_file_names(parent)
 
-    # De-dupe mkdir entries
-    seen = set()
-    deduped: List[MoveItem] = []
-    for item in plan:
-        if item.action == "mkdir":
-            key = str(item.proposed)
-            if key in seen:
-                continue
-            seen.add(key)
-        deduped.append(item)
+        # sidecar names are "<video stem><tail>"; the tail carries over onto base
+        stem_len = len(vid.stem)
+        for sc in find_sidecars(vid, file_names):
+            tail = sc.name[stem_len:]
+            proposed_sc = resolve_collision_path(movie_dir / (base + tail), movie_names)
+            plan.append(MoveItem(original=sc, proposed=proposed_sc, action="move_sidecar"))
 
-    return deduped
+    return plan
 
 
 def write_sort_csv(plan: List[MoveItem], csv_path: Path) -> None:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
+    with csv_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(["action", "original", "proposed"])
-        for item in plan:
-            w.writerow([item.action, str(item.original), str(item.proposed)])
+        # one writerows call over (action, original, proposed); csv str()s the Paths itself
+        w.writerows(map(attrgetter("action", "original", "proposed"), plan))
 
-def safe_move(src: Path, dst: Path, *, overwrite: bool = False, try_unlock: bool = False) -> bool:
-    dst.parent.mkdir(parents=True, exist_ok=True)
+def safe_move(src: Path, dst: Path, *, overwrite: bool = False, try_unlock: bool = False,
+              make_parent: bool = True) -> bool:
+    # make_parent=False: caller already created dst.parent (apply_sort_plan does, once per dir)
+    if make_parent:
+        dst.parent.mkdir(parents=True, exist_ok=True)
 
     def unlock_path(p: Path) -> None:
         # Best-effort: clear user immutable flag if present
@@ -463,18 +635,35 @@ def safe_move(src: Path, dst: Path, *, overwrite: bool = False, try_unlock: bool
 
 def apply_sort_plan(plan: List[MoveItem], *, overwrite: bool = False, try_unlock: bool = False) -> None:
 
-    # 1) mkdirs first
+    # every move lands in one of a few DEST dirs; mkdir (a stat + mkdir per
+    # missing level) each of them once, not before every single move
+    made_dirs: set[Path] = set()
+
+    def ensure_dir(d: Path) -> None:
+        if d not in made_dirs:
+            d.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(d)
+
+    # one pass over the plan, sorting items by action (plan order kept within each);
+    # the file buckets are listed in the order they get moved: sidecars, videos, attention
+    by_action: dict[str, List[MoveItem]] = {
+        "mkdir": [], "move_folder": [], "move_sidecar": [], "move_video": [], "move_attention": [],
+    }
     for item in plan:
-        if item.action == "mkdir":
-            Path(item.proposed).mkdir(parents=True, exist_ok=True)
+        bucket = by_action.get(item.action)
+        if bucket is not None:
+            bucket.append(item)
+
+    # 1) mkdirs first
+    for item in by_action["mkdir"]:
+        ensure_dir(Path(item.proposed))
 
     # 2) move folders first (so their contents don't get double-moved)
-    folders = [x for x in plan if x.action == "move_folder"]
-    for item in folders:
+    for item in by_action["move_folder"]:
         if not item.original.exists():
             print(f"[SKIP missing folder] {item.original}")
             continue
-        item.proposed.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(item.proposed.parent)
         try:
             shutil.move(str(item.original), str(item.proposed))
         except PermissionError as e:
@@ -482,15 +671,9 @@ def apply_sort_plan(plan: List[MoveItem], *, overwrite: bool = False, try_unlock
             continue
 
     # 3) then move individual files (with progress)
-    moves = [x for x in plan if x.action in {"move_sidecar", "move_video", "move_attention"}]
-
-    def order(x: MoveItem) -> int:
-        return {"move_sidecar": 0, "move_video": 1, "move_attention": 2}.get(x.action, 9)
-
-    moves.sort(key=order)
-
-    total = len(moves)
-    for i, item in enumerate(moves, start=1):
+    file_buckets = (by_action["move_sidecar"], by_action["move_video"], by_action["move_attention"])
+    total = sum(map(len, file_buckets))
+    for i, item in enumerate(chain.from_iterable(file_buckets), start=1):
         if i == 1 or i % 100 == 0 or i == total:
             pct = (i / total) * 100 if total else 100.0
             print(f"[{i}/{total}] {pct:6.2f}%")
@@ -499,7 +682,9 @@ def apply_sort_plan(plan: List[MoveItem], *, overwrite: bool = False, try_unlock
             print(f"[SKIP missing file] {item.original}")
             continue
 
-        ok = safe_move(item.original, item.proposed, overwrite=overwrite, try_unlock=try_unlock)
+        ensure_dir(item.proposed.parent)
+        ok = safe_move(item.original, item.proposed, overwrite=overwrite, try_unlock=try_unlock,
+                       make_parent=False)
 
 
         if not ok:
@@ -514,24 +699,40 @@ def count_dir_stats(dirpath: Path) -> Tuple[int, int]:
     subdirs = 0
     videos = 0
     try:
-        for p in dirpath.iterdir():
-            try:
-                if p.is_dir():
-                    subdirs += 1
-                elif p.is_file() and p.suffix.lower() in VALID_VIDEO_EXTENSIONS:
-                    videos += 1
-            except PermissionError:
-                # Can't stat this entry; ignore it
-                continue
+        # scandir: the dir/file type comes with the listing, so plain entries cost
+        # no stat (symlinks are still followed, like Path.is_dir/is_file)
+        with os.scandir(dirpath) as it:
+            for e in it:
+                try:
+                    if e.is_dir():
+                        subdirs += 1
+                    elif has_video_ext(e.name) and e.is_file():
+                        videos += 1
+                except PermissionError:
+                    # Can't stat this entry; ignore it
+                    continue
     except PermissionError:
         # Can't list this directory at all
         return (0, 0)
     return subdirs, videos
 
 
-def list_dirs_numbered(cwd: Path) -> List[Path]:
-    
+def mtime_ns(p: Path) -> int | None:
+    try:
+        return p.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def dir_stat_row(d: Path) -> Tuple[Path, int | None, int, int]:
+    # mtime is read before counting, so a change mid-count still shows up as moved
+    # on the next redraw
+    mtime = mtime_ns(d)
+    return (d, mtime, *count_dir_stats(d))
 
+
+def dir_listing_rows(cwd: Path) -> List[Tuple[Path, int | None, int, int]] | None:
+    """(dir, st_mtime_ns, subdir_count, video_count) for each browsable subfolder, sorted; None if cwd can't be listed."""
     dirs: List[Path] = []
     try:
         # Only include dirs we can actually access enough to browse
@@ -543,33 +744,69 @@ def list_dirs_numbered(cwd: Path) -> List[Path]:
                 continue
 
     except PermissionError:
-        print("\nFolders:")
-        print("  0) .. (up one level)")
-        print("  (No permission to list this directory.)")
-        return []
+        return None
 
     dirs.sort()
+    return [dir_stat_row(d) for d in dirs]
+
+
+def list_dirs_numbered(
+    cwd: Path,
+    cache: dict[Path, Tuple[int, List[Tuple[Path, int | None, int, int]] | None]] | None = None,
+) -> List[Path]:
+    """
+    Print cwd's subfolders (numbered, with counts) and return them.
+    cache (select_directory keeps one) maps a folder to (st_mtime_ns, rows): while
+    the folder's mtime hasn't moved its listing is reused, and each subfolder is
+    only recounted if its own mtime moved (the counts are non-recursive, so that's
+    exactly when they can change).
+    """
+    rows = None
+    mtime = None
+    if cache is not None:
+        mtime = mtime_ns(cwd)
+        hit = cache.get(cwd)
+        if hit is not None and mtime is not None and hit[0] == mtime:
+            rows = hit[1]
+            if rows is not None:
+                rows = [
+                    row if row[1] is not None and mtime_ns(row[0]) == row[1] else dir_stat_row(row[0])
+                    for row in rows
+                ]
+        else:
+            rows = dir_listing_rows(cwd)
+        if mtime is not None:
+            cache[cwd] = (mtime, rows)
+    else:
+        rows = dir_listing_rows(cwd)
 
     print("\nFolders:")
     print("  0) .. (up one level)")
-    for i, d in enumerate(dirs, start=1):
-        subdir_count, video_count = count_dir_stats(d)
+    if rows is None:
+        print("  (No permission to list this directory.)")
+        return []
+
+    for i, (d, _, subdir_count, video_count) in enumerate(rows, start=1):
         print(f"  {i}) {d.name}/ [{subdir_count} dirs | {video_count} videos]")
-    return dirs
+    return [d for d, _, _, _ in rows]
 
 
 def select_directory(start: Path) -> Path:
     cwd = start.resolve()
+    # listings seen in this browse session, checked against folder mtimes on each
+    # redraw (see list_dirs_numbered); 'r' drops the cached one anyway
+    listings: dict[Path, Tuple[int, List[Tuple[Path, int | None, int, int]] | None]] = {}
     while True:
         clear_screen()
         print(f"Current: {cwd}")
-        dirs = list_dirs_numbered(cwd)
+        dirs = list_dirs_numbered(cwd, listings)
         print("\nOptions: r=refresh, m=manual path, b=back/confirm")
         sel = input("Select #: ").strip().lower()
 
         if sel == "b":
             return cwd
         if sel == "r":
+            listings.pop(cwd, None)
             continue
         if sel == "0":
             if cwd.parent != cwd:
@@ -596,20 +833,22 @@ def select_directory(start: Path) -> Path:
 
 def validate_paths(source: Path, dest: Path) -> List[str]:
     issues = []
-    if not source.exists() or not source.is_dir():
+    # is_dir() is False for a missing path too, so one stat covers both
+    if not source.is_dir():
         issues.append("SOURCE does not exist or is not a directory.")
-    if not dest.exists() or not dest.is_dir():
+    if not dest.is_dir():
         issues.append("DEST does not exist or is not a directory.")
-    # prevent dest inside source (or same)
+    # prevent dest inside source (or same): one realpath per side, then plain
+    # string compares (commonpath of a path and one inside it is the outer path)
     try:
-        src = source.resolve()
-        dst = dest.resolve()
+        src = os.path.realpath(source)
+        dst = os.path.realpath(dest)
         if dst == src:
             issues.append("DEST cannot be the same as SOURCE.")
-        if dst.is_relative_to(src):
+        if os.path.commonpath([src, dst]) == src:
             issues.append("DEST cannot be inside SOURCE (would re-ingest moved files).")
-    except Exception:
-        # is_relative_to may fail on older python / weird paths
+    except (OSError, ValueError):
+        # commonpath refuses paths on different drives (Windows)
         pass
     return issues
 